@@ -14,27 +14,41 @@ from openenv.core import EnvClient
 
 from .models import BenchmarkAction, BenchmarkObservation
 
+# Benchmark-specific observation fields and their defaults when absent
+_OBS_DEFAULTS = (
+    ("waited_seconds", 0.0),
+    ("pid", 0),
+    ("session_hash", ""),
+    ("host_url", ""),
+    ("step_count", 0),
+)
+
 
 class BenchmarkEnv(EnvClient[BenchmarkAction, BenchmarkObservation, State]):
     """
     Client for the Benchmark Environment.
 
+    Each client holds a single WebSocket connection for its whole lifetime;
+    reset() and step() reuse it, so create one client per session and keep
+    it open rather than reconnecting for every call.
+
     Example:
         >>> # Connect to a running server
-        >>> client = BenchmarkEnv(base_url="http://localhost:8000")
-        >>> result = client.reset()
-        >>> print(result.observation.session_hash)
-        >>>
-        >>> # Test concurrency with wait
-        >>> result = client.step(BenchmarkAction(wait_seconds=1.0))
-        >>> print(result.observation.waited_seconds)
-        >>> print(result.observation.pid)
+        >>> async with BenchmarkEnv(base_url="http://localhost:8000") as client:
+        ...     result = await client.reset()
+        ...     print(result.observation.session_hash)
+        ...
+        ...     # Test concurrency with wait
+        ...     result = await client.step(BenchmarkAction(wait_seconds=1.0))
+        ...     print(result.observation.waited_seconds)
+        ...     print(result.observation.pid)
 
     Example with Docker:
         >>> # Automatically start container and connect
-        >>> client = BenchmarkEnv.from_docker_image("benchmark-env:latest")
-        >>> result = client.reset()
-        >>> result = client.step(BenchmarkAction(wait_seconds=0.5))
+        >>> client = await BenchmarkEnv.from_docker_image("benchmark-env:latest")
+        >>> result = await client.reset()
+        >>> result = await client.step(BenchmarkAction(wait_seconds=0.5))
+        >>> await client.close()
     """
 
     def _step_payload(self, action: BenchmarkAction) -> Dict:
@@ -45,22 +59,23 @@ class BenchmarkEnv(EnvClient[BenchmarkAction, BenchmarkObservation, State]):
 
     def _parse_result(self, payload: Dict) -> StepResult[BenchmarkObservation]:
         """Parse server response into StepResult[BenchmarkObservation]."""
-        obs_data = payload.get("observation", {})
-        observation = BenchmarkObservation(
-            waited_seconds=obs_data.get("waited_seconds", 0.0),
-            pid=obs_data.get("pid", 0),
-            session_hash=obs_data.get("session_hash", ""),
-            host_url=obs_data.get("host_url", ""),
-            step_count=obs_data.get("step_count", 0),
-            done=payload.get("done", False),
-            reward=payload.get("reward"),
+        obs_data = payload.get("observation") or {}
+        reward = payload.get("reward")
+        done = payload.get("done", False)
+
+        # The server already validated these values when serializing them,
+        # so build the model without running pydantic validation again
+        observation = BenchmarkObservation.model_construct(
+            done=done,
+            reward=reward,
             metadata=obs_data.get("metadata", {}),
+            **{key: obs_data.get(key, default) for key, default in _OBS_DEFAULTS},
         )
 
         return StepResult(
             observation=observation,
-            reward=payload.get("reward"),
-            done=payload.get("done", False),
+            reward=reward,
+            done=done,
         )
 
     def _parse_state(self, payload: Dict) -> State:
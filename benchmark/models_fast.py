@@ -0,0 +1,60 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+msgspec mirrors of the Benchmark Environment wire format.
+
+The server keeps using the pydantic models in models.py, since openenv-core's
+create_app validates actions and serializes observations through them. These
+structs are for load generators and analysis tools that talk JSON to the
+server directly and only need fast (de)serialization, e.g.:
+
+    >>> body = encoder.encode(StepRequest(action=BenchmarkAction(wait_seconds=1.0)))
+    >>> response = step_response_decoder.decode(resp.content)
+    >>> print(response.observation.session_hash)
+
+Requires the optional ``msgspec`` dependency (``pip install msgspec``).
+"""
+
+from typing import Any, Dict, Optional
+
+import msgspec
+
+
+class BenchmarkAction(msgspec.Struct):
+    """Action for the Benchmark environment - wait for a duration."""
+
+    wait_seconds: float = 0.0
+
+
+class BenchmarkObservation(msgspec.Struct):
+    """Observation from Benchmark environment - concurrency test metrics."""
+
+    waited_seconds: float = 0.0
+    pid: int = 0
+    session_hash: str = ""
+    host_url: str = ""
+    step_count: int = 0
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class StepRequest(msgspec.Struct):
+    """Body of a POST /step request."""
+
+    action: BenchmarkAction
+
+
+class StepResponse(msgspec.Struct):
+    """Body of a /reset or /step response (also the ``data`` of a WS reply)."""
+
+    observation: BenchmarkObservation
+    reward: Optional[float] = None
+    done: bool = False
+
+
+# Reusable codecs - building these once avoids per-call setup
+encoder = msgspec.json.Encoder()
+step_response_decoder = msgspec.json.Decoder(StepResponse)
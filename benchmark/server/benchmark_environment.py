@@ -11,11 +11,11 @@ A test environment designed for benchmarking server concurrency.
 Each session gets its own environment instance, enabling true concurrent execution.
 """
 
-import hashlib
+import asyncio
 import os
+import secrets
 import socket
 import time
-from uuid import uuid4
 
 from openenv.core.env_server.interfaces import Environment
 from openenv.core.env_server.types import State
@@ -23,6 +23,20 @@ from openenv.core.env_server.types import State
 from benchmark.models import BenchmarkAction, BenchmarkObservation
 
 
+def _get_host_url() -> str:
+    """Get the host URL for debugging."""
+    try:
+        hostname = socket.gethostname()
+        return f"{hostname}:{os.getenv('PORT', '8000')}"
+    except Exception:
+        return "unknown"
+
+
+# Process-wide constants, resolved once per worker instead of per session
+_HOST_URL = _get_host_url()
+_PID = os.getpid()
+
+
 class BenchmarkEnvironment(Environment):
     """
     A benchmark environment for testing server concurrency.
@@ -31,7 +45,7 @@ class BenchmarkEnvironment(Environment):
     Each instance maintains its own state and can run independently.
 
     Key features:
-    - Sleeps for a configurable duration on each step
+    - Sleeps for a configurable duration on each step (non-blocking via step_async)
     - Returns process ID and session hash to verify concurrency
     - Thread-safe and supports multiple concurrent sessions
 
@@ -43,6 +57,8 @@ class BenchmarkEnvironment(Environment):
         >>> obs = env.step(BenchmarkAction(wait_seconds=1.0))
         >>> print(obs.waited_seconds)  # ~1.0
         >>> print(obs.pid)  # Process ID
+        >>>
+        >>> obs = await env.step_async(BenchmarkAction(wait_seconds=1.0))
     """
 
     # Enable concurrent WebSocket sessions
@@ -50,21 +66,11 @@ class BenchmarkEnvironment(Environment):
 
     def __init__(self):
         """Initialize the benchmark environment."""
-        self._session_id = str(uuid4())
-        self._session_hash = hashlib.sha256(
-            self._session_id.encode()
-        ).hexdigest()[:12]
+        # 48 random bits are plenty to tell sessions apart; the same token
+        # doubles as the episode id, which only needs to be a string
+        self._session_hash = secrets.token_hex(6)
+        self._session_id = self._session_hash
         self._state = State(episode_id=self._session_id, step_count=0)
-        self._pid = os.getpid()
-        self._host_url = self._get_host_url()
-
-    def _get_host_url(self) -> str:
-        """Get the host URL for debugging."""
-        try:
-            hostname = socket.gethostname()
-            return f"{hostname}:{os.getenv('PORT', '8000')}"
-        except Exception:
-            return "unknown"
 
     def reset(self) -> BenchmarkObservation:
         """
@@ -77,9 +83,9 @@ class BenchmarkEnvironment(Environment):
 
         return BenchmarkObservation(
             waited_seconds=0.0,
-            pid=self._pid,
+            pid=_PID,
             session_hash=self._session_hash,
-            host_url=self._host_url,
+            host_url=_HOST_URL,
             step_count=0,
         )
 
@@ -103,9 +109,38 @@ class BenchmarkEnvironment(Environment):
 
         return BenchmarkObservation(
             waited_seconds=wait_seconds,
-            pid=self._pid,
+            pid=_PID,
+            session_hash=self._session_hash,
+            host_url=_HOST_URL,
+            step_count=self._state.step_count,
+        )
+
+    async def step_async(self, action: BenchmarkAction) -> BenchmarkObservation:
+        """
+        Execute a step without blocking the event loop.
+
+        The server awaits this instead of running step() in a thread pool, so
+        concurrent sessions on one worker overlap their waits.
+
+        Args:
+            action: BenchmarkAction containing wait_seconds
+
+        Returns:
+            BenchmarkObservation with timing and concurrency info
+        """
+        self._state.step_count += 1
+
+        wait_seconds = action.wait_seconds
+
+        # Cooperative sleep - other sessions keep running meanwhile
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+        return BenchmarkObservation(
+            waited_seconds=wait_seconds,
+            pid=_PID,
             session_hash=self._session_hash,
-            host_url=self._host_url,
+            host_url=_HOST_URL,
             step_count=self._state.step_count,
         )
 
@@ -0,0 +1,50 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Single-worker launcher for the Benchmark Environment server.
+
+Steps are I/O-bound waits: step_async() awaits asyncio.sleep, so one event
+loop overlaps every concurrent session's wait. Extra worker processes only
+add memory and connection imbalance, so this entry point pins uvicorn to a
+single worker. Any sync step() fallback runs on the server's thread pool,
+never in a process pool.
+
+Install the ``uvloop`` extra (``pip install "openenv-benchmark[uvloop]"``)
+to run on uvloop and httptools; without it the stdlib asyncio loop and
+h11 parser are used.
+
+Usage:
+    python -m benchmark.server.run
+    python -m benchmark.server.run --port 8001
+"""
+
+import argparse
+
+import uvicorn
+
+from .app import app
+
+
+def main(host: str = "0.0.0.0", port: int = 8000):
+    """
+    Run the app on one uvicorn worker.
+
+    Args:
+        host: Host address to bind to (default: "0.0.0.0")
+        port: Port number to listen on (default: 8000)
+    """
+    # "auto" picks uvloop and httptools when they are installed, and falls
+    # back to asyncio / h11 otherwise
+    uvicorn.run(app, host=host, port=port, workers=1, loop="auto", http="auto")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the benchmark server on a single worker")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    main(host=args.host, port=args.port)
@@ -0,0 +1,55 @@
+"""
+Helpers shared by the plotting scripts (plot_scaling_curves.py,
+plot_scaling_comparison.py and plot_all.py).
+"""
+
+import os
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+from matplotlib.ticker import StrMethodFormatter
+
+# Batch size tick labels with thousands separators (e.g. 16,384)
+COMMA_FMT = StrMethodFormatter('{x:,.0f}')
+
+# Column types for the cached summary; mode is dictionary-encoded in parquet.
+# wait_seconds stays float64 so lookups like wait == 1.0 remain exact.
+SUMMARY_DTYPES = {
+    "mode": "category",
+    "num_requests": "int32",
+    "wait_seconds": "float64",
+    "successful": "int32",
+    "failed": "int32",
+    "error_rate": "float64",
+}
+
+
+def load_summary(csv_path: Path, columns: List[str]) -> pd.DataFrame:
+    """
+    Load the given columns of a summary CSV.
+
+    The first read writes a typed summary.parquet next to the CSV; later
+    reads use it while it is at least as new as the CSV. Without a parquet
+    engine (pyarrow), or if the cache can't be read, this falls back to
+    reading the CSV.
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            return pd.read_parquet(parquet_path, columns=columns)
+        except Exception:
+            pass  # Rebuilt from the CSV below
+
+    df = pd.read_csv(csv_path, dtype=SUMMARY_DTYPES)
+
+    # Written under a hidden temporary name and moved into place, so an
+    # interrupted run never leaves a partial cache behind
+    tmp_path = parquet_path.with_name(f".{parquet_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, parquet_path)
+    except (ImportError, OSError):
+        # The cache is best-effort (no parquet engine, read-only results)
+        tmp_path.unlink(missing_ok=True)
+    return df[columns]
@@ -25,14 +25,26 @@ Usage:
 """
 
 import argparse
-import csv
 import json
 import os
 import sys
-from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import pandas as pd
+except ImportError:
+    print("Error: pandas is required. Install with: pip install pandas")
+    sys.exit(1)
+
+# Optional: orjson for faster JSONL parsing (json.loads also accepts bytes)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Optional: matplotlib for figures
 try:
@@ -45,43 +57,72 @@ except ImportError:
     HAS_MATPLOTLIB = False
 
 
-def load_summary_csv(csv_path: Path) -> List[Dict[str, Any]]:
-    """Load summary CSV into list of dicts."""
+# Column types for the summary.csv fields the analysis reads, so read_csv
+# skips per-column type inference and numeric columns are never left as object
+_SUMMARY_DTYPES = {
+    "mode": str,
+    "num_requests": "int64",
+    "wait_seconds": "float64",
+    "error_rate": "float64",
+    "connect_p50": "float64",
+    "reset_p50": "float64",
+    "step_p50": "float64",
+    "total_p99": "float64",
+    "requests_per_second": "float64",
+}
+
+
+def load_summary_csv(csv_path: Path) -> pd.DataFrame:
+    """Load summary CSV into a DataFrame (empty if the file is missing)."""
     if not csv_path.exists():
-        return []
-
-    with open(csv_path) as f:
-        reader = csv.DictReader(f)
-        rows = []
-        for row in reader:
-            # Convert numeric fields
-            for key in row:
-                try:
-                    if "." in row[key]:
-                        row[key] = float(row[key])
-                    else:
-                        row[key] = int(row[key])
-                except (ValueError, TypeError):
-                    pass
-            rows.append(row)
-        return rows
-
-
-def load_raw_jsonl(jsonl_path: Path) -> List[Dict[str, Any]]:
-    """Load raw JSONL into list of dicts."""
+        return pd.DataFrame()
+
+    data = pd.read_csv(csv_path, dtype=_SUMMARY_DTYPES)
+    # Discrete wait key computed once, so every filter is an equality match
+    data["wait_key"] = data["wait_seconds"].round(2)
+    return data
+
+
+def iter_raw_jsonl(jsonl_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield raw JSONL rows one at a time so callers can aggregate in a single pass."""
     if not jsonl_path.exists():
-        return []
+        return
 
-    rows = []
-    with open(jsonl_path) as f:
+    with open(jsonl_path, "rb") as f:
         for line in f:
             if line.strip():
-                rows.append(json.loads(line))
-    return rows
+                yield _json_loads(line)
+
+
+# (infrastructure, mode, wait_seconds) -> (max_batch_size, median summary row)
+MaxBatchIndex = Dict[Tuple[str, str, float], Tuple[int, Dict]]
+
+
+def _max_batch_in_group(
+    filtered: pd.DataFrame,
+    success_threshold: float,
+) -> Tuple[Optional[int], Optional[Dict]]:
+    """Find the max passing batch size among rows of a single (mode, wait) group."""
+    # Average success rate per num_requests (batch_size)
+    success_rate = 1 - filtered["error_rate"]
+    avg_rate = success_rate.groupby(filtered["num_requests"]).mean()
+
+    # Find max batch size with avg success >= threshold
+    passing = avg_rate[avg_rate >= success_threshold]
+    if passing.empty:
+        return None, None
+
+    max_batch = int(passing.index.max())
+
+    # Use the row with median performance
+    batch_rows = success_rate[filtered["num_requests"] == max_batch].sort_values(kind="stable")
+    max_row = filtered.loc[batch_rows.index[len(batch_rows) // 2]].to_dict()
+
+    return max_batch, max_row
 
 
 def compute_max_batch_size(
-    summary_data: List[Dict],
+    summary_data: pd.DataFrame,
     mode: str,
     wait_seconds: float,
     success_threshold: float = 0.95,
@@ -91,43 +132,70 @@ def compute_max_batch_size(
 
     Returns (max_batch_size, summary_row) or (None, None) if none pass.
     """
+    if summary_data.empty:
+        return None, None
+
     # Filter by mode and wait_seconds
-    filtered = [
-        row for row in summary_data if row.get("mode") == mode and abs(row.get("wait_seconds", 0) - wait_seconds) < 0.01
-    ]
+    filtered = summary_data[(summary_data["mode"] == mode) & (summary_data["wait_key"] == round(wait_seconds, 2))]
 
-    if not filtered:
+    if filtered.empty:
         return None, None
 
-    # Group by num_requests (batch_size) and compute average success rate
-    batch_stats = defaultdict(list)
-    for row in filtered:
-        batch_size = row.get("num_requests", 0)
-        success_rate = 1 - row.get("error_rate", 0)
-        batch_stats[batch_size].append((success_rate, row))
+    return _max_batch_in_group(filtered, success_threshold)
 
-    # Find max batch size with avg success >= threshold
-    max_batch = None
-    max_row = None
 
-    for batch_size in sorted(batch_stats.keys()):
-        rates = [x[0] for x in batch_stats[batch_size]]
-        avg_rate = sum(rates) / len(rates)
+def combine_results(results: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate per-infrastructure summaries into one frame with an ``infra`` column."""
+    frames = [data.assign(infra=infra_id) for infra_id, data in results.items() if not data.empty]
+    if not frames:
+        return pd.DataFrame(columns=["infra", "mode", "wait_seconds", "wait_key", "num_requests"])
+    return pd.concat(frames, ignore_index=True)
 
-        if avg_rate >= success_threshold:
-            max_batch = batch_size
-            # Use the row with median performance
-            sorted_rows = sorted(batch_stats[batch_size], key=lambda x: x[0])
-            max_row = sorted_rows[len(sorted_rows) // 2][1]
 
-    return max_batch, max_row
+def precompute_max_batches(
+    results: Dict[str, pd.DataFrame],
+    success_threshold: float = 0.95,
+    combined: Optional[pd.DataFrame] = None,
+) -> MaxBatchIndex:
+    """
+    Compute the max batch size for every (infrastructure, mode, wait) at once.
+
+    All rows are grouped a single time; the table and figure generators then
+    do dict lookups via lookup_max_batch() instead of re-filtering the data
+    for every cell.
+    """
+    if combined is None:
+        combined = combine_results(results)
+
+    max_batches = {}
+
+    for (infra_id, mode, wait), group in combined.groupby(["infra", "mode", "wait_key"]):
+        max_batch, max_row = _max_batch_in_group(group, success_threshold)
+        if max_batch is not None:
+            max_batches[(infra_id, mode, float(wait))] = (max_batch, max_row)
+
+    return max_batches
+
+
+def lookup_max_batch(
+    max_batches: MaxBatchIndex,
+    infra_id: str,
+    mode: str,
+    wait_seconds: float,
+) -> Tuple[Optional[int], Optional[Dict]]:
+    """Look up a precomputed (max_batch_size, summary_row), or (None, None)."""
+    return max_batches.get((infra_id, mode, round(wait_seconds, 2)), (None, None))
 
 
 def generate_max_batch_table(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     success_threshold: float = 0.95,
+    max_batches: Optional[MaxBatchIndex] = None,
 ) -> str:
     """Generate Table 1: Maximum Batch Size by Infrastructure."""
+    if max_batches is None:
+        max_batches = precompute_max_batches(results, success_threshold)
+
     wait_times = [0.1, 1.0, 5.0]
     modes = ["ws", "http"]
 
@@ -140,11 +208,11 @@ def generate_max_batch_table(
         "|----------------|------|-----------|-----------|-----------|",
     ]
 
-    for infra_id, data in sorted(results.items()):
+    for infra_id in sorted(results):
         for mode in modes:
             row = f"| {infra_id:<14} | {mode:<4} |"
             for wait in wait_times:
-                max_batch, _ = compute_max_batch_size(data, mode, wait, success_threshold)
+                max_batch, _ = lookup_max_batch(max_batches, infra_id, mode, wait)
                 cell = str(max_batch) if max_batch else "-"
                 row += f" {cell:^9} |"
             lines.append(row)
@@ -153,10 +221,14 @@ def generate_max_batch_table(
 
 
 def generate_protocol_comparison_table(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     success_threshold: float = 0.95,
+    max_batches: Optional[MaxBatchIndex] = None,
 ) -> str:
     """Generate Table 2: Protocol Comparison (HTTP vs WebSocket)."""
+    if max_batches is None:
+        max_batches = precompute_max_batches(results, success_threshold)
+
     wait_times = [0.1, 1.0, 5.0]
 
     lines = [
@@ -166,10 +238,10 @@ def generate_protocol_comparison_table(
         "|----------------|--------|--------|----------|---------------|--------|",
     ]
 
-    for infra_id, data in sorted(results.items()):
+    for infra_id in sorted(results):
         for wait in wait_times:
-            ws_max, _ = compute_max_batch_size(data, "ws", wait, success_threshold)
-            http_max, _ = compute_max_batch_size(data, "http", wait, success_threshold)
+            ws_max, _ = lookup_max_batch(max_batches, infra_id, "ws", wait)
+            http_max, _ = lookup_max_batch(max_batches, infra_id, "http", wait)
 
             ws_str = str(ws_max) if ws_max else "-"
             http_str = str(http_max) if http_max else "-"
@@ -190,10 +262,14 @@ def generate_protocol_comparison_table(
 
 
 def generate_latency_table(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     success_threshold: float = 0.95,
+    max_batches: Optional[MaxBatchIndex] = None,
 ) -> str:
     """Generate Table 3: Latency Breakdown at Max Load."""
+    if max_batches is None:
+        max_batches = precompute_max_batches(results, success_threshold)
+
     lines = [
         "## Table 3: Latency Breakdown at Max Load (wait=1.0s)",
         "",
@@ -201,9 +277,9 @@ def generate_latency_table(
         "|----------------|------|-------------|-----------|----------|-----------|",
     ]
 
-    for infra_id, data in sorted(results.items()):
+    for infra_id in sorted(results):
         for mode in ["ws", "http"]:
-            _, max_row = compute_max_batch_size(data, mode, 1.0, success_threshold)
+            _, max_row = lookup_max_batch(max_batches, infra_id, mode, 1.0)
 
             if max_row:
                 connect = max_row.get("connect_p50", 0)
@@ -222,11 +298,15 @@ def generate_latency_table(
 
 
 def generate_results_summary(
-    data: List[Dict],
+    data: pd.DataFrame,
     infrastructure: str,
     success_threshold: float = 0.95,
+    max_batches: Optional[MaxBatchIndex] = None,
 ) -> str:
     """Generate summary table for experiment log entry."""
+    if max_batches is None:
+        max_batches = precompute_max_batches({infrastructure: data}, success_threshold)
+
     lines = [
         "| Mode | wait_s | Max Batch | p99 Latency | Success % | RPS |",
         "|------|--------|-----------|-------------|-----------|-----|",
@@ -234,7 +314,7 @@ def generate_results_summary(
 
     for mode in ["ws", "http"]:
         for wait in [0.1, 1.0, 5.0]:
-            max_batch, row = compute_max_batch_size(data, mode, wait, success_threshold)
+            max_batch, row = lookup_max_batch(max_batches, infrastructure, mode, wait)
 
             if row:
                 p99 = row.get("total_p99", 0)
@@ -260,37 +340,29 @@ INFRA_CORES = {
 
 
 def plot_scaling_curves(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     output_dir: Path,
     wait_seconds: float = 1.0,
+    combined: Optional[pd.DataFrame] = None,
 ):
     """Generate Figure 2: Scaling Curves (WebSocket only)."""
     if not HAS_MATPLOTLIB:
         print("Warning: matplotlib not installed, skipping figure generation")
         return
 
-    fig, ax = plt.subplots(1, 1, figsize=(10, 6))
-
-    for infra_id, data in sorted(results.items()):
-        # Filter data - WebSocket only
-        filtered = [
-            row for row in data if row.get("mode") == "ws" and abs(row.get("wait_seconds", 0) - wait_seconds) < 0.01
-        ]
-
-        if not filtered:
-            continue
+    if combined is None:
+        combined = combine_results(results)
 
-        # Group by batch size and average
-        batch_stats = defaultdict(list)
-        for row in filtered:
-            batch_size = row.get("num_requests", 0)
-            success_rate = (1 - row.get("error_rate", 0)) * 100
-            batch_stats[batch_size].append(success_rate)
+    # Mean success rate per (infra, batch size) in one grouping pass - WebSocket only
+    filtered = combined[(combined["mode"] == "ws") & (combined["wait_key"] == round(wait_seconds, 2))]
+    success_rate = (1 - filtered["error_rate"]) * 100
+    curves = success_rate.groupby([filtered["infra"], filtered["num_requests"]]).mean()
 
-        x = sorted(batch_stats.keys())
-        y = [sum(batch_stats[b]) / len(batch_stats[b]) for b in x]
+    fig, ax = plt.subplots(1, 1, figsize=(10, 6))
 
-        ax.plot(x, y, marker="o", label=infra_id, linewidth=2, markersize=6)
+    for infra_id, batch_stats in curves.groupby(level="infra"):
+        batch_stats = batch_stats.droplevel("infra")
+        ax.plot(batch_stats.index, batch_stats.values, marker="o", label=infra_id, linewidth=2, markersize=6)
 
     ax.axhline(y=95, color="r", linestyle="--", alpha=0.5, label="95% threshold")
     ax.set_xlabel("Batch Size")
@@ -311,14 +383,18 @@ def plot_scaling_curves(
 
 
 def plot_max_batch_comparison(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     output_dir: Path,
     success_threshold: float = 0.95,
+    max_batches: Optional[MaxBatchIndex] = None,
 ):
     """Generate Figure 1: Max Batch Size Comparison (WebSocket only)."""
     if not HAS_MATPLOTLIB:
         return
 
+    if max_batches is None:
+        max_batches = precompute_max_batches(results, success_threshold)
+
     wait_times = [1.0, 5.0, 10.0]
     infrastructures = sorted(results.keys())
 
@@ -328,7 +404,7 @@ def plot_max_batch_comparison(
         ws_values = []
 
         for infra in infrastructures:
-            ws_max, _ = compute_max_batch_size(results[infra], "ws", wait, success_threshold)
+            ws_max, _ = lookup_max_batch(max_batches, infra, "ws", wait)
             ws_values.append(ws_max or 0)
 
         x = range(len(infrastructures))
@@ -358,53 +434,32 @@ def plot_max_batch_comparison(
 
 
 def plot_latency_heatmap(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     output_dir: Path,
+    combined: Optional[pd.DataFrame] = None,
 ):
     """Generate Figure 4: Latency Heatmap (WebSocket only)."""
     if not HAS_MATPLOTLIB:
         return
 
-    # Collect all batch sizes (WS only)
-    all_batch_sizes = set()
-    for data in results.values():
-        for row in data:
-            if row.get("mode") == "ws":
-                all_batch_sizes.add(row.get("num_requests", 0))
+    if combined is None:
+        combined = combine_results(results)
 
-    batch_sizes = sorted(all_batch_sizes)
+    # Columns cover every WS batch size seen at any wait time
+    ws = combined[combined["mode"] == "ws"]
+    batch_sizes = sorted(ws["num_requests"].unique())
     infrastructures = sorted(results.keys())
 
-    # Build heatmap matrix
-    matrix = []
-    for infra in infrastructures:
-        row = []
-        data = results[infra]
-
-        for batch in batch_sizes:
-            # Find matching row (wait=1.0s, WS only)
-            matching = [
-                r
-                for r in data
-                if r.get("mode") == "ws"
-                and r.get("num_requests") == batch
-                and abs(r.get("wait_seconds", 0) - 1.0) < 0.01
-            ]
-
-            if matching:
-                avg_p99 = sum(r.get("total_p99", 0) for r in matching) / len(matching)
-                row.append(avg_p99)
-            else:
-                row.append(float("nan"))
-
-        matrix.append(row)
+    # Heatmap matrix: mean p99 per batch size (wait=1.0s, WS only)
+    matching = ws[ws["wait_key"] == 1.0]
+    matrix = (
+        matching.pivot_table(index="infra", columns="num_requests", values="total_p99", aggfunc="mean")
+        .reindex(index=infrastructures, columns=batch_sizes)
+        .to_numpy(dtype=float)
+    )
 
     fig, ax = plt.subplots(figsize=(12, 6))
 
-    import numpy as np
-
-    matrix = np.array(matrix)
-
     im = ax.imshow(matrix, aspect="auto", cmap="YlOrRd")
 
     ax.set_xticks(range(len(batch_sizes)))
@@ -427,14 +482,18 @@ def plot_latency_heatmap(
 
 
 def plot_batch_per_core(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     output_dir: Path,
     success_threshold: float = 0.95,
+    max_batches: Optional[MaxBatchIndex] = None,
 ):
     """Generate Figure: Batch Size Per Core comparison."""
     if not HAS_MATPLOTLIB:
         return
 
+    if max_batches is None:
+        max_batches = precompute_max_batches(results, success_threshold)
+
     wait_seconds = 1.0
     infrastructures = sorted(results.keys())
 
@@ -444,7 +503,7 @@ def plot_batch_per_core(
     colors = []
 
     for infra in infrastructures:
-        ws_max, _ = compute_max_batch_size(results[infra], "ws", wait_seconds, success_threshold)
+        ws_max, _ = lookup_max_batch(max_batches, infra, "ws", wait_seconds)
         cores = INFRA_CORES.get(infra, 1)
 
         if ws_max:
@@ -539,7 +598,7 @@ def main():
                     summary_path = subdir / "summary.csv"
                     if summary_path.exists():
                         data = load_summary_csv(summary_path)
-                        if data:
+                        if not data.empty:
                             results[infra_dir.name] = data
                             print(f"Loaded {len(data)} rows from {summary_path}")
                         break
@@ -565,14 +624,22 @@ def main():
     output_dir = Path(args.output) if args.output else Path("experiments/reports/figures")
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # One frame and one max-batch index shared by every table and figure below
+    combined = combine_results(results)
+    max_batches = precompute_max_batches(results, args.success_threshold, combined)
+
     # Generate tables
     if not args.figures_only:
+        max_batch_table = generate_max_batch_table(results, args.success_threshold, max_batches)
+        protocol_table = generate_protocol_comparison_table(results, args.success_threshold, max_batches)
+        latency_table = generate_latency_table(results, args.success_threshold, max_batches)
+
         print("\n" + "=" * 70)
-        print(generate_max_batch_table(results, args.success_threshold))
+        print(max_batch_table)
         print()
-        print(generate_protocol_comparison_table(results, args.success_threshold))
+        print(protocol_table)
         print()
-        print(generate_latency_table(results, args.success_threshold))
+        print(latency_table)
         print("=" * 70)
 
         # Save tables to file
@@ -580,21 +647,21 @@ def main():
         with open(tables_path, "w") as f:
             f.write("# OpenEnv Scaling Experiment Results\n\n")
             f.write(f"Generated: {datetime.now().isoformat()}\n\n")
-            f.write(generate_max_batch_table(results, args.success_threshold))
+            f.write(max_batch_table)
             f.write("\n\n")
-            f.write(generate_protocol_comparison_table(results, args.success_threshold))
+            f.write(protocol_table)
             f.write("\n\n")
-            f.write(generate_latency_table(results, args.success_threshold))
+            f.write(latency_table)
         print(f"\nSaved tables to: {tables_path}")
 
     # Generate figures
     if not args.tables_only:
         if HAS_MATPLOTLIB:
             print("\nGenerating figures...")
-            plot_max_batch_comparison(results, output_dir, args.success_threshold)
-            plot_scaling_curves(results, output_dir)
-            plot_latency_heatmap(results, output_dir)
-            plot_batch_per_core(results, output_dir, args.success_threshold)
+            plot_max_batch_comparison(results, output_dir, args.success_threshold, max_batches)
+            plot_scaling_curves(results, output_dir, combined=combined)
+            plot_latency_heatmap(results, output_dir, combined=combined)
+            plot_batch_per_core(results, output_dir, args.success_threshold, max_batches)
             print(f"\nFigures saved to: {output_dir}")
         else:
             print("\nWarning: matplotlib not installed, skipping figures")
@@ -604,7 +671,7 @@ def main():
     if len(results) == 1:
         infra_id = list(results.keys())[0]
         print(f"\n--- Results Summary for {infra_id} ---")
-        print(generate_results_summary(results[infra_id], infra_id, args.success_threshold))
+        print(generate_results_summary(results[infra_id], infra_id, args.success_threshold, max_batches))
         print("\nCopy the above table to EXPERIMENT_LOG.md")
 
 
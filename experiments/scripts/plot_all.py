@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Generate all scaling figures in one run.
+
+Renders the per-infrastructure scaling curves (plot_scaling_curves.py) and
+the single- vs multi-node comparison (plot_scaling_comparison.py) in one
+process. Each summary is loaded once and shared by both figures, so
+matplotlib, the plot style and any CSV parsing are paid for once.
+
+Usage:
+    python experiments/scripts/plot_all.py
+    python experiments/scripts/plot_all.py --mode http
+    python experiments/scripts/plot_all.py --formats png,pdf
+    python -m experiments.scripts.plot_all
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+# Make the repository root importable when run by path rather than with -m
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from experiments.scripts._plot_common import load_summary
+from experiments.scripts.plot_scaling_comparison import (
+    MULTI_NODE_CSV,
+    SINGLE_NODE_CSV,
+    SUCCESS_RATE_COLUMNS,
+    compute_success_rates,
+    plot_scaling_comparison,
+)
+from experiments.scripts.plot_scaling_curves import (
+    SUMMARY_COLUMNS,
+    find_latest_results,
+    plot_scaling_curves,
+)
+
+# Every column either figure reads
+COLUMNS = list(dict.fromkeys(SUMMARY_COLUMNS + SUCCESS_RATE_COLUMNS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate all scaling figures")
+    parser.add_argument(
+        "--mode", "-m",
+        choices=["ws", "http"],
+        default="ws",
+        help="Protocol mode for the scaling curves (default: ws)",
+    )
+    parser.add_argument(
+        "--threshold", "-t",
+        type=float,
+        default=95.0,
+        help="Success rate threshold percentage (default: 95.0)",
+    )
+    parser.add_argument(
+        "--results-dir",
+        type=Path,
+        default=Path("experiments/results"),
+        help="Base directory for experiment results",
+    )
+    parser.add_argument(
+        "--formats",
+        default="png",
+        help="Comma-separated formats for the comparison plot, e.g. 'png,pdf' (default: png)",
+    )
+
+    args = parser.parse_args()
+
+    # Summaries by path, so a file used by both figures is loaded once
+    frames: Dict[Path, pd.DataFrame] = {}
+
+    def load(csv_path: Path) -> pd.DataFrame:
+        if csv_path not in frames:
+            frames[csv_path] = load_summary(csv_path, COLUMNS)
+        return frames[csv_path]
+
+    # Scaling curves across the latest results of every infrastructure
+    infra_paths = find_latest_results(args.results_dir) if args.results_dir.is_dir() else {}
+    results = {}
+    for infra_id, csv_path in infra_paths.items():
+        data = load(csv_path)
+        if not data.empty:
+            results[infra_id] = data
+
+    if results:
+        plot_scaling_curves(results, mode=args.mode, success_threshold=args.threshold)
+    else:
+        print(f"Skipping scaling curves: no results in {args.results_dir}")
+
+    # Single- vs multi-node comparison
+    if SINGLE_NODE_CSV.exists() and MULTI_NODE_CSV.exists():
+        plot_scaling_comparison(
+            compute_success_rates(load(SINGLE_NODE_CSV)),
+            compute_success_rates(load(MULTI_NODE_CSV)),
+            formats=args.formats.split(","),
+        )
+    else:
+        print(f"Skipping comparison: {SINGLE_NODE_CSV} or {MULTI_NODE_CSV} not found")
+
+
+if __name__ == "__main__":
+    main()
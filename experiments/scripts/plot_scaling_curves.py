@@ -16,19 +16,40 @@ Usage:
 """
 
 import argparse
-import csv
+import os
+import sys
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Dict, List, Tuple
 
 try:
-    import matplotlib.pyplot as plt
     import matplotlib
     matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import matplotlib.style as mplstyle
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
 except ImportError:
     print("Error: matplotlib is required. Install with: pip install matplotlib")
     exit(1)
 
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    print("Error: pandas is required. Install with: pip install pandas")
+    exit(1)
+
+# Make the repository root importable when run by path rather than with -m
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from experiments.scripts._plot_common import COMMA_FMT, load_summary
+
+
+# Figure style, resolved once and applied per figure via rc_context so the
+# global rcParams are left untouched
+_STYLE = dict(mplstyle.library['seaborn-v0_8-whitegrid'])
 
 # Infrastructure display names and colors
 INFRA_CONFIG = {
@@ -39,85 +60,70 @@ INFRA_CONFIG = {
     "slurm-multi": {"label": "SLURM Multi", "color": "#f39c12", "marker": "p"},
 }
 
+# Columns compute_scaling_table reads
+SUMMARY_COLUMNS = ["mode", "wait_seconds", "num_requests", "successful", "error_rate"]
 
-def load_summary_csv(csv_path: Path) -> List[Dict[str, Any]]:
-    """Load summary CSV into list of dicts."""
+
+def load_summary_csv(csv_path: Path, columns: List[str] = SUMMARY_COLUMNS) -> pd.DataFrame:
+    """Load summary CSV into a DataFrame (empty if the file is missing)."""
     if not csv_path.exists():
-        return []
-
-    with open(csv_path) as f:
-        reader = csv.DictReader(f)
-        rows = []
-        for row in reader:
-            for key in row:
-                try:
-                    if '.' in str(row[key]):
-                        row[key] = float(row[key])
-                    else:
-                        row[key] = int(row[key])
-                except (ValueError, TypeError):
-                    pass
-            rows.append(row)
-        return rows
+        return pd.DataFrame(columns=columns)
+
+    return load_summary(csv_path, columns)
 
 
 def find_latest_results(results_dir: Path) -> Dict[str, Path]:
     """Find the most recent results for each infrastructure."""
     infra_paths = {}
 
-    for infra_dir in results_dir.iterdir():
-        if not infra_dir.is_dir():
-            continue
+    # scandir entries carry the dirent type, so is_dir() needs no extra stat
+    with os.scandir(results_dir) as infra_entries:
+        infra_dirs = [entry for entry in infra_entries if entry.is_dir()]
 
-        # Find most recent date directory with results
-        for date_dir in sorted(infra_dir.iterdir(), reverse=True):
-            summary_path = date_dir / "summary.csv"
-            if summary_path.exists():
-                infra_paths[infra_dir.name] = summary_path
-                break
+    for infra_dir in infra_dirs:
+        # Find most recent date directory with results in one pass
+        latest = None
+        with os.scandir(infra_dir.path) as date_entries:
+            for date_dir in date_entries:
+                if latest is not None and date_dir.name <= latest.name:
+                    continue
+                if date_dir.is_dir() and os.path.exists(os.path.join(date_dir.path, "summary.csv")):
+                    latest = date_dir
+
+        if latest is not None:
+            infra_paths[infra_dir.name] = Path(latest.path) / "summary.csv"
 
     return infra_paths
 
 
-def compute_scaling_data(
-    data: List[Dict],
-    mode: str,
-    wait_seconds: float,
-) -> tuple[List[int], List[float]]:
+def compute_scaling_table(results: Dict[str, pd.DataFrame]) -> pd.Series:
     """
-    Compute average success rate per batch size.
+    Compute average success rate for every (infra, mode, wait_seconds, batch size) at once.
 
-    Returns (batch_sizes, success_rates) sorted by batch size.
+    Runs with no requests or no successful sessions (e.g. the server wasn't
+    ready) are skipped. A single groupby over all infrastructures serves
+    every plotted line; slice it with table.loc[(infra_id, mode, round(wait, 2))].
     """
-    # Filter by mode and wait_seconds
-    # Also filter out completely failed runs (e.g., server not ready)
-    filtered = [
-        row for row in data
-        if row.get("mode") == mode
-        and abs(row.get("wait_seconds", 0) - wait_seconds) < 0.01
-        and row.get("num_requests", 0) > 0
-        and row.get("successful", 0) > 0  # Skip runs where server wasn't ready
-    ]
-
-    if not filtered:
-        return [], []
+    data = pd.concat([df.assign(infra=infra_id) for infra_id, df in results.items()], ignore_index=True)
+    filtered = data[(data["num_requests"] > 0) & (data["successful"] > 0)]
+    success_rate = (1 - filtered["error_rate"]) * 100
+    keys = [filtered["infra"], filtered["mode"], filtered["wait_seconds"].round(2), filtered["num_requests"]]
+    return success_rate.groupby(keys, observed=True).mean().sort_index()
 
-    # Group by batch size and compute average success rate
-    batch_stats = defaultdict(list)
-    for row in filtered:
-        batch_size = row.get("num_requests", 0)
-        success_rate = (1 - row.get("error_rate", 0)) * 100
-        batch_stats[batch_size].append(success_rate)
 
-    # Sort by batch size and compute averages
-    batch_sizes = sorted(batch_stats.keys())
-    success_rates = [sum(batch_stats[b]) / len(batch_stats[b]) for b in batch_sizes]
-
-    return batch_sizes, success_rates
+def max_batches_at_threshold(
+    scaling_table: pd.Series,
+    mode: str,
+    success_threshold: float,
+) -> Dict[Tuple[str, float], int]:
+    """Largest batch size meeting the threshold, keyed by (infra, rounded wait_seconds)."""
+    passing = scaling_table[scaling_table >= success_threshold].index.to_frame(index=False)
+    passing = passing[passing["mode"] == mode]
+    return passing.groupby(["infra", "wait_seconds"])["num_requests"].max().to_dict()
 
 
 def plot_scaling_curves_single(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     ax: plt.Axes,
     mode: str = "ws",
     wait_seconds: float = 1.0,
@@ -132,18 +138,23 @@ def plot_scaling_curves_single(
     """
     max_batches = {}
 
-    for infra_id, data in sorted(results.items()):
+    scaling_table = compute_scaling_table(results)
+    passing_batches = max_batches_at_threshold(scaling_table, mode, success_threshold)
+
+    for infra_id in sorted(results):
         config = INFRA_CONFIG.get(infra_id, {
             "label": infra_id,
             "color": "#7f8c8d",
             "marker": "o"
         })
 
-        batch_sizes, success_rates = compute_scaling_data(data, mode, wait_seconds)
-
-        if not batch_sizes:
+        try:
+            batch_stats = scaling_table.loc[(infra_id, mode, round(wait_seconds, 2))]
+        except KeyError:
             continue
 
+        batch_sizes, success_rates = batch_stats.index.tolist(), batch_stats.tolist()
+
         ax.plot(
             batch_sizes,
             success_rates,
@@ -155,10 +166,8 @@ def plot_scaling_curves_single(
             alpha=0.9,
         )
 
-        # Find max batch at threshold
-        for batch, rate in zip(batch_sizes, success_rates):
-            if rate >= success_threshold:
-                max_batches[infra_id] = batch
+        if (infra_id, round(wait_seconds, 2)) in passing_batches:
+            max_batches[infra_id] = passing_batches[(infra_id, round(wait_seconds, 2))]
 
     # Add threshold line
     ax.axhline(
@@ -177,7 +186,7 @@ def plot_scaling_curves_single(
     ax.set_ylim(-5, 105)
 
     # Format x-axis ticks
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{int(x):,}'))
+    ax.xaxis.set_major_formatter(COMMA_FMT)
 
     # Grid
     ax.grid(True, alpha=0.3, which='both')
@@ -191,8 +200,9 @@ def plot_scaling_curves_single(
     return max_batches
 
 
+@plt.rc_context(_STYLE)
 def plot_scaling_curves_combined(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     mode: str = "ws",
     durations: List[float] = None,
     output_path: Path = None,
@@ -202,7 +212,7 @@ def plot_scaling_curves_combined(
     Generate combined scaling curves figure with line styles for runtime duration.
 
     Args:
-        results: Dict mapping infrastructure name to list of summary rows
+        results: Dict mapping infrastructure name to its summary DataFrame
         mode: Protocol mode ("ws" or "http")
         durations: List of runtime durations in seconds (default: [1.0, 5.0, 10.0])
         output_path: Path to save figure
@@ -219,46 +229,61 @@ def plot_scaling_curves_combined(
     }
 
     # Set up the figure
-    plt.style.use('seaborn-v0_8-whitegrid')
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    # Collect all max batches for summary
-    all_max_batches = {}
+    # Every line below is a slice of one aggregate over all infrastructures
+    scaling_table = compute_scaling_table(results)
+    passing_batches = max_batches_at_threshold(scaling_table, mode, success_threshold)
 
-    # Plot each infrastructure and duration combination
-    for infra_id, data in sorted(results.items()):
-        config = INFRA_CONFIG.get(infra_id, {
-            "label": infra_id,
-            "color": "#7f8c8d",
-            "marker": "o"
-        })
+    # Resolve each infrastructure's label/color/marker once for lines, legend and summary
+    configs = {
+        infra_id: INFRA_CONFIG.get(infra_id, {"label": infra_id, "color": "#7f8c8d", "marker": "o"})
+        for infra_id in sorted(results)
+    }
 
-        if infra_id not in all_max_batches:
-            all_max_batches[infra_id] = {}
+    # Collect all max batches for summary
+    all_max_batches = {infra_id: {} for infra_id in configs}
 
-        for duration in durations:
-            batch_sizes, success_rates = compute_scaling_data(data, mode, duration)
+    # Lines are drawn as one LineCollection and markers as one scatter per
+    # glyph, rather than one Line2D artist per (infrastructure, duration)
+    segments, segment_colors, segment_styles = [], [], []
+    marker_points = defaultdict(lambda: ([], [], []))  # marker -> (xs, ys, colors)
 
-            if not batch_sizes:
+    # Collect each infrastructure and duration combination
+    for infra_id, config in configs.items():
+        for duration in durations:
+            try:
+                batch_stats = scaling_table.loc[(infra_id, mode, round(duration, 2))]
+            except KeyError:
                 continue
 
+            batch_sizes, success_rates = batch_stats.index.tolist(), batch_stats.tolist()
+
             style = DURATION_STYLES.get(duration, {"linestyle": "-", "label": f"{duration}s"})
 
-            ax.plot(
-                batch_sizes,
-                success_rates,
-                marker=config["marker"],
-                color=config["color"],
-                linestyle=style["linestyle"],
-                linewidth=2,
-                markersize=6,
-                alpha=0.85,
-            )
-
-            # Find max batch at threshold
-            for batch, rate in zip(batch_sizes, success_rates):
-                if rate >= success_threshold:
-                    all_max_batches[infra_id][duration] = batch
+            segments.append(np.column_stack([batch_sizes, success_rates]))
+            segment_colors.append(config["color"])
+            segment_styles.append(style["linestyle"])
+
+            xs, ys, colors = marker_points[config["marker"]]
+            xs.extend(batch_sizes)
+            ys.extend(success_rates)
+            colors.extend([config["color"]] * len(batch_sizes))
+
+            if (infra_id, round(duration, 2)) in passing_batches:
+                all_max_batches[infra_id][duration] = passing_batches[(infra_id, round(duration, 2))]
+
+    if segments:
+        ax.add_collection(LineCollection(
+            segments,
+            colors=segment_colors,
+            linestyles=segment_styles,
+            linewidths=2,
+            alpha=0.85,
+        ))
+        for marker, (xs, ys, colors) in marker_points.items():
+            ax.scatter(xs, ys, c=colors, marker=marker, s=6 ** 2, alpha=0.85, zorder=3)
+        ax.autoscale_view()
 
     # Add threshold line
     ax.axhline(
@@ -276,7 +301,7 @@ def plot_scaling_curves_combined(
     ax.set_ylim(-5, 105)
 
     # Format x-axis ticks
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{int(x):,}'))
+    ax.xaxis.set_major_formatter(COMMA_FMT)
 
     # Grid
     ax.grid(True, alpha=0.3, which='both')
@@ -291,23 +316,18 @@ def plot_scaling_curves_combined(
     )
 
     # Create custom legend with two parts: infrastructure (color) and duration (line style)
-    from matplotlib.lines import Line2D
+    infra_handles = [
+        Line2D([0], [0], color=config["color"], marker=config["marker"],
+               linestyle='-', linewidth=2, markersize=6, label=config["label"])
+        for config in configs.values()
+    ]
 
-    # Infrastructure legend entries
-    infra_handles = []
-    for infra_id in sorted(results.keys()):
-        config = INFRA_CONFIG.get(infra_id, {"label": infra_id, "color": "#7f8c8d", "marker": "o"})
-        handle = Line2D([0], [0], color=config["color"], marker=config["marker"],
-                       linestyle='-', linewidth=2, markersize=6, label=config["label"])
-        infra_handles.append(handle)
-
-    # Duration legend entries
-    duration_handles = []
-    for duration in durations:
-        style = DURATION_STYLES.get(duration, {"linestyle": "-", "label": f"{duration}s"})
-        handle = Line2D([0], [0], color='gray', linestyle=style["linestyle"],
-                       linewidth=2, label=f'{style["label"]} runtime')
-        duration_handles.append(handle)
+    duration_styles = [DURATION_STYLES.get(d, {"linestyle": "-", "label": f"{d}s"}) for d in durations]
+    duration_handles = [
+        Line2D([0], [0], color='gray', linestyle=style["linestyle"],
+               linewidth=2, label=f'{style["label"]} runtime')
+        for style in duration_styles
+    ]
 
     # Threshold legend entry
     threshold_handle = Line2D([0], [0], color='#e74c3c', linestyle='-',
@@ -327,8 +347,7 @@ def plot_scaling_curves_combined(
     # Add summary annotation
     if all_max_batches:
         annotation_lines = [f"Max batch @ {success_threshold:.0f}%:"]
-        for infra_id in sorted(all_max_batches.keys()):
-            config = INFRA_CONFIG.get(infra_id, {"label": infra_id})
+        for infra_id, config in configs.items():
             batches = all_max_batches[infra_id]
             if batches:
                 min_batch = min(batches.values())
@@ -363,8 +382,7 @@ def plot_scaling_curves_combined(
     header = f"{'Infrastructure':<20} " + " ".join(f"{'duration='+str(d)+'s':>12}" for d in durations)
     print(header)
     print("-" * len(header))
-    for infra_id in sorted(all_max_batches.keys()):
-        config = INFRA_CONFIG.get(infra_id, {"label": infra_id})
+    for infra_id, config in configs.items():
         row = f"{config['label']:<20} "
         for duration in durations:
             batch = all_max_batches[infra_id].get(duration, "N/A")
@@ -378,8 +396,9 @@ def plot_scaling_curves_combined(
     return output_path
 
 
+@plt.rc_context(_STYLE)
 def plot_scaling_curves(
-    results: Dict[str, List[Dict]],
+    results: Dict[str, pd.DataFrame],
     mode: str = "ws",
     wait_seconds: float = None,
     output_path: Path = None,
@@ -400,7 +419,6 @@ def plot_scaling_curves(
         )
 
     # Single panel mode
-    plt.style.use('seaborn-v0_8-whitegrid')
     fig, ax = plt.subplots(figsize=(10, 6))
 
     max_batches = plot_scaling_curves_single(
@@ -525,7 +543,7 @@ Examples:
     results = {}
     for infra_id, csv_path in infra_paths.items():
         data = load_summary_csv(csv_path)
-        if data:
+        if not data.empty:
             results[infra_id] = data
 
     if not results:
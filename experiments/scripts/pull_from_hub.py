@@ -12,10 +12,15 @@ Usage:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Iterator
 
 try:
-    from huggingface_hub import HfApi, hf_hub_download, list_repo_files
+    from huggingface_hub import HfApi, hf_hub_download
+    from huggingface_hub.errors import EntryNotFoundError
+    from huggingface_hub.hf_api import RepoFile
+    from huggingface_hub.utils.sha import git_hash, sha_fileobj
 except ImportError:
     print("Error: huggingface_hub is required. Install with: pip install huggingface_hub")
     exit(1)
@@ -23,6 +28,58 @@ except ImportError:
 
 DEFAULT_REPO_ID = "burtenshaw/openenv-scaling"
 BASE_DIR = Path("experiments")
+DEFAULT_WORKERS = 16
+
+# Top-level repo directories that are pulled
+TARGET_ROOTS = ("results", "reports")
+
+
+def iter_target_files(api: HfApi, repo_id: str, filter_prefix: str | None = None) -> Iterator[RepoFile]:
+    """
+    Yield the repo files under results/ and reports/ (and filter_prefix, if given).
+
+    Each listing is scoped server-side to the deepest directory the filter
+    allows, so unrelated parts of the repo are never fetched. Entries carry
+    size and hash, which is all is_up_to_date() needs.
+    """
+    for root in TARGET_ROOTS:
+        path_in_repo = root
+        if filter_prefix:
+            if filter_prefix.startswith(f"{root}/"):
+                path_in_repo = filter_prefix.rsplit("/", 1)[0]
+            elif not f"{root}/".startswith(filter_prefix):
+                continue
+
+        try:
+            entries = api.list_repo_tree(
+                repo_id=repo_id,
+                path_in_repo=path_in_repo,
+                recursive=True,
+                repo_type="dataset",
+            )
+            for entry in entries:
+                if isinstance(entry, RepoFile) and (not filter_prefix or entry.path.startswith(filter_prefix)):
+                    yield entry
+        except EntryNotFoundError:
+            continue  # Directory doesn't exist in this repo
+
+
+def is_up_to_date(local_path: Path, remote: RepoFile | None) -> bool:
+    """
+    Check whether a local file matches its copy on the Hub.
+
+    Sizes are compared first (a stat call); the file is only hashed when the
+    sizes match, using sha256 for LFS files and the git blob hash otherwise.
+    """
+    if remote is None or not local_path.is_file():
+        return False
+    if local_path.stat().st_size != remote.size:
+        return False
+
+    if remote.lfs is not None:
+        with open(local_path, "rb") as f:
+            return sha_fileobj(f).hex() == remote.lfs.sha256
+    return git_hash(local_path.read_bytes()) == remote.blob_id
 
 
 def pull_from_hub(
@@ -31,6 +88,7 @@ def pull_from_hub(
     dry_run: bool = False,
     filter_prefix: str | None = None,
     force: bool = False,
+    workers: int = DEFAULT_WORKERS,
 ):
     """
     Pull experiment results and reports from Hugging Face Hub.
@@ -40,28 +98,20 @@ def pull_from_hub(
         base_dir: Local base directory to save files (files will be saved relative to this)
         dry_run: If True, only print what would be downloaded
         filter_prefix: Only download files matching this prefix (e.g., "results/local-uvicorn")
-        force: If True, overwrite existing files
+        force: If True, download every file, overwriting local copies even if they differ from the Hub
+        workers: Number of files to download concurrently
     """
     api = HfApi()
 
-    # List all files in the repository
+    # List only the results/ and reports/ subtrees (narrowed by the user filter)
     print(f"Fetching file list from: {repo_id}")
     try:
-        files = list_repo_files(repo_id=repo_id, repo_type="dataset")
+        remote_files = {entry.path: entry for entry in iter_target_files(api, repo_id, filter_prefix)}
     except Exception as e:
         print(f"Error: Could not list files from {repo_id}: {e}")
         exit(1)
 
-    # Filter to only results/ and reports/ directories
-    target_files = [
-        f for f in files
-        if (f.startswith("results/") or f.startswith("reports/"))
-        and not f.endswith("/")
-    ]
-
-    # Apply user filter if specified
-    if filter_prefix:
-        target_files = [f for f in target_files if f.startswith(filter_prefix)]
+    target_files = list(remote_files)
 
     if not target_files:
         print("No files found to download!")
@@ -69,20 +119,28 @@ def pull_from_hub(
             print(f"  (filter: {filter_prefix})")
         return
 
-    # Check which files already exist
+    # Only files missing locally are downloaded. The listing carries each
+    # file's size and hash, so existing files are checked against it: a local
+    # copy that differs (e.g. fresh results not pushed yet) is kept and
+    # reported rather than overwritten, unless --force is given.
     files_to_download = []
     files_skipped = []
+    files_differing = []
 
     for repo_path in target_files:
         local_path = base_dir / repo_path
-        if local_path.exists() and not force:
+        if force or not local_path.is_file():
+            files_to_download.append((repo_path, local_path))
+        elif is_up_to_date(local_path, remote_files[repo_path]):
             files_skipped.append((repo_path, local_path))
         else:
-            files_to_download.append((repo_path, local_path))
+            files_differing.append((repo_path, local_path))
 
     print(f"\nFound {len(target_files)} files in repository:")
     print(f"  - {len(files_to_download)} to download")
-    print(f"  - {len(files_skipped)} already exist (use --force to overwrite)")
+    print(f"  - {len(files_skipped)} already up to date (use --force to re-download)")
+    if files_differing:
+        print(f"  - {len(files_differing)} differ locally and are kept (use --force to overwrite)")
 
     if files_to_download:
         print("\nFiles to download:")
@@ -90,12 +148,17 @@ def pull_from_hub(
             print(f"  {repo_path} -> {local_path}")
 
     if files_skipped and not force:
-        print("\nSkipping existing files:")
+        print("\nSkipping up-to-date files:")
         for repo_path, local_path in sorted(files_skipped[:10]):
             print(f"  {repo_path}")
         if len(files_skipped) > 10:
             print(f"  ... and {len(files_skipped) - 10} more")
 
+    if files_differing:
+        print("\nWarning: keeping local files that differ from the Hub copy (use --force to overwrite):")
+        for repo_path, local_path in sorted(files_differing):
+            print(f"  {local_path}")
+
     if dry_run:
         print("\n[DRY RUN] No files downloaded.")
         return
@@ -104,31 +167,34 @@ def pull_from_hub(
         print("\nNo new files to download.")
         return
 
-    # Download files
-    print(f"\nDownloading from {repo_id}...")
+    # Download the planned files concurrently, straight into base_dir. Each
+    # file is fetched by exact name, so the listing above is not repeated.
+    print(f"\nDownloading {len(files_to_download)} files from {repo_id} ({workers} workers)...")
     downloaded = 0
     errors = 0
 
-    for repo_path, local_path in files_to_download:
-        print(f"  Downloading: {repo_path}")
-        try:
-            # Create parent directories
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Download file
-            downloaded_path = hf_hub_download(
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                hf_hub_download,
                 repo_id=repo_id,
                 filename=repo_path,
                 repo_type="dataset",
                 local_dir=base_dir,
-                local_dir_use_symlinks=False,
-            )
-
-            downloaded += 1
-
-        except Exception as e:
-            print(f"    Error: {e}")
-            errors += 1
+                # Every planned file is missing locally or forced
+                force_download=True,
+            ): repo_path
+            for repo_path, _ in files_to_download
+        }
+        for future in as_completed(futures):
+            repo_path = futures[future]
+            try:
+                future.result()
+                print(f"  Downloaded: {repo_path}")
+                downloaded += 1
+            except Exception as e:
+                print(f"  Error: {repo_path}: {e}")
+                errors += 1
 
     print(f"\nDone! Downloaded {downloaded} files, {errors} errors.")
     print(f"Files saved to: {base_dir.absolute()}")
@@ -153,7 +219,7 @@ def main():
     parser.add_argument(
         "--force", "-f",
         action="store_true",
-        help="Overwrite existing files",
+        help="Re-download every file, overwriting local copies that differ from the Hub",
     )
     parser.add_argument(
         "--base-dir",
@@ -167,6 +233,12 @@ def main():
         dest="filter_prefix",
         help="Only download files matching this prefix (e.g., 'results/local-uvicorn')",
     )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of concurrent downloads (default: {DEFAULT_WORKERS})",
+    )
 
     args = parser.parse_args()
 
@@ -182,6 +254,7 @@ def main():
         dry_run=args.dry_run,
         filter_prefix=args.filter_prefix,
         force=args.force,
+        workers=args.workers,
     )
 
 
@@ -8,13 +8,15 @@ Usage:
     python experiments/scripts/push_to_hub.py
     python experiments/scripts/push_to_hub.py --repo-id myuser/myrepo
     python experiments/scripts/push_to_hub.py --dry-run
+    python experiments/scripts/push_to_hub.py --no-high-performance
 """
 
 import argparse
+import os
 from pathlib import Path
 
 try:
-    from huggingface_hub import HfApi, login
+    from huggingface_hub import CommitOperationAdd, HfApi, login
 except ImportError:
     print("Error: huggingface_hub is required. Install with: pip install huggingface_hub")
     exit(1)
@@ -23,21 +25,49 @@ except ImportError:
 DEFAULT_REPO_ID = "burtenshaw/openenv-scaling"
 RESULTS_DIR = Path("experiments/results")
 REPORTS_DIR = Path("experiments/reports")
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 1) * 2)
 
+# (threshold, unit) pairs for human-readable sizes, largest first
+SIZE_UNITS = [(1 << 30, "GB"), (1 << 20, "MB"), (1 << 10, "KB")]
 
-def find_result_files(base_dir: Path) -> list[tuple[Path, str]]:
+
+def format_size(size: int) -> str:
+    """Format a byte count as a human-readable string."""
+    for threshold, unit in SIZE_UNITS:
+        if size >= threshold:
+            return f"{size / threshold:.1f} {unit}"
+    return f"{size:,} bytes"
+
+
+def _walk_files(directory: str):
+    """Yield DirEntry objects for all files under directory, skipping hidden entries."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def find_result_files(base_dir: Path) -> list[tuple[Path, str, int]]:
     """
     Find all result files to upload.
 
-    Returns list of (local_path, repo_path) tuples.
+    Hidden files and directories (e.g. .gitkeep) are skipped.
+
+    Returns list of (local_path, repo_path, size_bytes) tuples.
     """
     files = []
+    root = str(base_dir.parent)
 
-    for path in base_dir.rglob("*"):
-        if path.is_file() and path.name != ".gitkeep":
-            # Compute path relative to base_dir
-            rel_path = path.relative_to(base_dir.parent)
-            files.append((path, str(rel_path)))
+    for entry in _walk_files(str(base_dir)):
+        # summary.parquet is a local read cache written by the plot scripts
+        if entry.name != "summary.parquet":
+            # Compute path relative to base_dir's parent
+            rel_path = os.path.relpath(entry.path, root)
+            files.append((Path(entry.path), rel_path, entry.stat(follow_symlinks=False).st_size))
 
     return files
 
@@ -48,6 +78,8 @@ def push_to_hub(
     reports_dir: Path = REPORTS_DIR,
     dry_run: bool = False,
     private: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    api: HfApi | None = None,
 ):
     """
     Push experiment results and reports to Hugging Face Hub.
@@ -58,8 +90,10 @@ def push_to_hub(
         reports_dir: Local directory containing reports/figures
         dry_run: If True, only print what would be uploaded
         private: If True, create private repository
+        workers: Number of files to upload concurrently
+        api: Client to use (a new HfApi if not given)
     """
-    api = HfApi()
+    api = api or HfApi()
 
     # Collect files to upload
     files_to_upload = []
@@ -77,10 +111,8 @@ def push_to_hub(
         return
 
     print(f"Found {len(files_to_upload)} files to upload:")
-    for local_path, repo_path in sorted(files_to_upload, key=lambda x: x[1]):
-        size = local_path.stat().st_size
-        size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB" if size < 1024*1024 else f"{size/1024/1024:.1f} MB"
-        print(f"  {repo_path} ({size_str})")
+    for local_path, repo_path, size in sorted(files_to_upload, key=lambda x: x[1]):
+        print(f"  {repo_path} ({format_size(size)})")
 
     if dry_run:
         print("\n[DRY RUN] No files uploaded.")
@@ -98,20 +130,26 @@ def push_to_hub(
     except Exception as e:
         print(f"Warning: Could not create repo: {e}")
 
-    # Upload files
-    print(f"\nUploading to {repo_id}...")
-
-    for local_path, repo_path in files_to_upload:
-        print(f"  Uploading: {repo_path}")
-        try:
-            api.upload_file(
-                path_or_fileobj=str(local_path),
-                path_in_repo=repo_path,
-                repo_id=repo_id,
-                repo_type="dataset",
-            )
-        except Exception as e:
-            print(f"    Error: {e}")
+    # Upload all files in a single commit; the preupload and LFS transfers are batched
+    print(f"\nUploading {len(files_to_upload)} files to {repo_id} ({workers} workers)...")
+
+    # Largest first, so big LFS transfers start early and small files fill in around them
+    files_to_upload.sort(key=lambda x: x[2], reverse=True)
+    operations = [
+        CommitOperationAdd(path_in_repo=repo_path, path_or_fileobj=str(local_path))
+        for local_path, repo_path, _ in files_to_upload
+    ]
+    try:
+        api.create_commit(
+            repo_id=repo_id,
+            repo_type="dataset",
+            operations=operations,
+            commit_message=f"Upload {len(operations)} experiment files",
+            num_threads=workers,
+        )
+    except Exception as e:
+        print(f"Error: Upload failed: {e}")
+        exit(1)
 
     print(f"\nDone! View at: https://huggingface.co/datasets/{repo_id}")
 
@@ -218,9 +256,25 @@ def main():
         action="store_true",
         help="Also upload a generated README.md dataset card",
     )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of concurrent uploads (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-high-performance",
+        action="store_true",
+        help="Disable Xet high-performance transfers (fewer parallel connections, for flaky links)",
+    )
 
     args = parser.parse_args()
 
+    # hf_xet is imported lazily on first transfer and reads this at that point.
+    # An explicit HF_XET_HIGH_PERFORMANCE in the environment always wins.
+    if not args.no_high_performance:
+        os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+
     # Check directories exist
     if not args.results_dir.exists():
         print(f"Error: Results directory not found: {args.results_dir}")
@@ -231,18 +285,20 @@ def main():
     print(f"Reports dir: {args.reports_dir}")
     print()
 
+    api = HfApi()
     push_to_hub(
         repo_id=args.repo_id,
         results_dir=args.results_dir,
         reports_dir=args.reports_dir,
         dry_run=args.dry_run,
         private=args.private,
+        workers=args.workers,
+        api=api,
     )
 
     # Optionally upload README
     if args.with_readme and not args.dry_run:
         print("\nUploading dataset card (README.md)...")
-        api = HfApi()
         readme_content = create_dataset_card(args.repo_id)
         api.upload_file(
             path_or_fileobj=readme_content.encode(),
@@ -24,19 +24,29 @@ Usage:
 """
 
 import argparse
+import importlib.util
 import os
+import re
 import subprocess
 import sys
+import traceback
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Progress marker test_scaling.py prints before each grid run, e.g. "[3/40]"
+PROGRESS_RE = re.compile(r"^\[\d+/\d+\]$")
+
 
 def load_config(config_path: Path) -> dict:
     """Load experiment configuration from YAML file."""
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def get_infrastructure_config(config: dict, infra_id: str) -> dict:
@@ -77,6 +87,48 @@ def build_command(
     return cmd
 
 
+def run_streaming(cmd: list) -> Iterator[str]:
+    """
+    Run a command, echoing and yielding its output line by line as it arrives.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero status
+    """
+    # Unbuffered child output, so lines arrive as they are printed rather than in 8 KB blocks
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, env=env
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            yield line
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def run_in_process(cmd: list):
+    """
+    Run a test_scaling.py command in this interpreter instead of a subprocess.
+
+    Raises:
+        subprocess.CalledProcessError: If the test exits with a non-zero status
+            or raises, as a crashing subprocess would
+    """
+    try:
+        spec = importlib.util.spec_from_file_location("test_scaling", cmd[1])
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.run(cmd[2:])
+    except SystemExit as e:
+        if e.code:
+            raise subprocess.CalledProcessError(e.code if isinstance(e.code, int) else 1, cmd)
+    except Exception:
+        # An uncaught error in the subprocess prints its traceback and exits 1
+        traceback.print_exc()
+        raise subprocess.CalledProcessError(1, cmd)
+
+
 def generate_log_entry(
     infra_id: str,
     infra_config: dict,
@@ -130,21 +182,45 @@ def generate_log_entry(
 
 
 def append_to_log(log_path: Path, entry: str):
-    """Append experiment entry to the log file."""
+    """
+    Insert experiment entry after the runs marker in the log file.
+
+    Appends at the end if the marker is not found.
+    """
     with open(log_path, "r") as f:
         content = f.read()
-    
+
     # Find the marker for where to insert new runs
     marker = "<!-- EXPERIMENT RUNS START -->"
-    if marker in content:
-        parts = content.split(marker)
-        new_content = parts[0] + marker + "\n" + entry + parts[1]
+    head, found, tail = content.partition(marker)
+    if found:
+        new_content = head + marker + "\n" + entry + tail
     else:
         # Append at end if marker not found
         new_content = content + "\n" + entry
-    
-    with open(log_path, "w") as f:
-        f.write(new_content)
+
+    write_log(log_path, new_content)
+
+
+def update_log_entry(log_path: Path, old_entry: str, new_entry: str):
+    """Replace an entry added by append_to_log, e.g. to record a run's final status."""
+    with open(log_path, "r") as f:
+        content = f.read()
+
+    # The entry may have been edited or removed by hand while the run was going
+    if old_entry in content:
+        write_log(log_path, content.replace(old_entry, new_entry, 1))
+
+
+def write_log(log_path: Path, content: str):
+    """
+    Write the log file via a temporary file moved into place, so an
+    interrupted write leaves the previous log intact.
+    """
+    tmp_path = log_path.with_name(log_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(content)
+    os.replace(tmp_path, log_path)
 
 
 def main():
@@ -206,6 +282,11 @@ def main():
         action="store_true",
         help="Don't append to experiment log",
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run test_scaling.py in this interpreter instead of a subprocess",
+    )
     
     args = parser.parse_args()
     
@@ -286,29 +367,37 @@ def main():
     # Start time
     start_time = datetime.utcnow()
     
-    # Generate and append log entry (as "Running")
-    if not args.no_log:
-        log_path = Path("experiments/reports/EXPERIMENT_LOG.md")
-        if log_path.exists():
-            entry = generate_log_entry(
-                infra_id=args.infrastructure,
-                infra_config=infra_config,
-                url=args.url,
-                command=" ".join(cmd),
-                output_dir=output_dir,
-                start_time=start_time,
-                status="Running",
-            )
-            append_to_log(log_path, entry)
-            print(f"Log entry added to {log_path}")
+    # Generate and append log entry (as "Running"); it is updated with the
+    # final status once the run ends
+    log_path = Path("experiments/reports/EXPERIMENT_LOG.md")
+    entry = None
+    if not args.no_log and log_path.exists():
+        entry = generate_log_entry(
+            infra_id=args.infrastructure,
+            infra_config=infra_config,
+            url=args.url,
+            command=" ".join(cmd),
+            output_dir=output_dir,
+            start_time=start_time,
+            status="Running",
+        )
+        append_to_log(log_path, entry)
+        print(f"Log entry added to {log_path}")
     
     # Run experiment
     print()
     print("Starting experiment...")
     print("-" * 70)
     
+    last_run = None
     try:
-        result = subprocess.run(cmd, check=True)
+        if args.in_process:
+            run_in_process(cmd)
+        else:
+            for line in run_streaming(cmd):
+                line = line.strip()
+                if PROGRESS_RE.match(line):
+                    last_run = line
         status = "Complete"
     except subprocess.CalledProcessError as e:
         print(f"\nExperiment failed with exit code {e.returncode}")
@@ -316,9 +405,29 @@ def main():
     except KeyboardInterrupt:
         print("\nExperiment interrupted")
         status = "Interrupted"
+
+    if status != "Complete" and last_run:
+        print(f"Last run started: {last_run}")
     
     end_time = datetime.utcnow()
     duration = (end_time - start_time).total_seconds()
+
+    if entry is not None:
+        final_status = status if status == "Complete" or not last_run else f"{status} (last run started: {last_run})"
+        update_log_entry(
+            log_path,
+            entry,
+            generate_log_entry(
+                infra_id=args.infrastructure,
+                infra_config=infra_config,
+                url=args.url,
+                command=" ".join(cmd),
+                output_dir=output_dir,
+                start_time=start_time,
+                end_time=end_time,
+                status=final_status,
+            ),
+        )
     
     print("-" * 70)
     print(f"Status: {status}")
@@ -39,16 +39,16 @@ Usage:
 
 import argparse
 import asyncio
+import contextlib
 import csv
 import json
+import operator
 import os
-import statistics
 import sys
 import time
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, BinaryIO, Dict, Iterable, List, Optional, Sequence
 
 try:
     import httpx
@@ -56,18 +56,38 @@ except ImportError:
     print("Install httpx: pip install httpx")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("Install numpy: pip install numpy")
+    sys.exit(1)
+
 try:
     import websockets
 except ImportError:
     websockets = None
 
+# Optional: orjson for faster JSON encoding/decoding (both return/accept bytes).
+# Both encoders serialize dataclass instances directly, without an asdict() copy.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=asdict).encode()
+
+    _json_loads = json.loads
+
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionResult:
     """Result from a single session with granular latency breakdown."""
 
@@ -101,7 +121,7 @@ class SessionResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSummary:
     """Aggregated summary for a single (mode, N, wait, rep) configuration."""
 
@@ -164,15 +184,11 @@ class RunSummary:
 # =============================================================================
 
 
-def percentile(data: List[float], p: float) -> float:
-    """Calculate percentile of a list."""
-    if not data:
-        return 0.0
-    sorted_data = sorted(data)
-    k = (len(sorted_data) - 1) * p / 100
-    f = int(k)
-    c = min(f + 1, len(sorted_data) - 1)
-    return sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f])
+def percentiles(data: np.ndarray, ps: Sequence[float]) -> List[float]:
+    """Calculate several percentiles of an array (linear interpolation, one sort)."""
+    if not data.size:
+        return [0.0] * len(ps)
+    return np.percentile(data, ps).tolist()
 
 
 def convert_to_ws_url(url: str) -> str:
@@ -187,9 +203,42 @@ def convert_to_ws_url(url: str) -> str:
     return "ws://" + url + "/ws"
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last now_iso() call
+_iso_second = (None, "")
+
+
 def now_iso() -> str:
-    """Return current timestamp in ISO format."""
-    return datetime.utcnow().isoformat() + "Z"
+    """Return current UTC timestamp in ISO format (microsecond precision)."""
+    global _iso_second
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    if seconds != _iso_second[0]:
+        # Only format the date/time part when the second changes
+        _iso_second = (seconds, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)))
+    return f"{_iso_second[1]}.{micros:06d}Z"
+
+
+async def run_sessions(sessions: Iterable[Awaitable[SessionResult]]) -> List[SessionResult]:
+    """Run session coroutines concurrently and return their results in order.
+
+    Uses asyncio.TaskGroup on Python 3.11+, so an interrupt cancels the
+    remaining sessions cleanly; falls back to gather on 3.10.
+    """
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(session) for session in sessions]
+        return [task.result() for task in tasks]
+    return list(await asyncio.gather(*sessions))
+
+
+if hasattr(asyncio, "timeout"):  # Python 3.11+
+
+    async def with_timeout(aw: Awaitable, timeout: float):
+        """Await aw with a timeout, using a timeout scope instead of a wrapper task."""
+        async with asyncio.timeout(timeout):
+            return await aw
+
+else:
+    with_timeout = asyncio.wait_for
 
 
 class MultiNodeValidationError(Exception):
@@ -255,37 +304,52 @@ def validate_host_distribution(
 # HTTP Mode
 # =============================================================================
 
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Most sessions in flight at once (and HTTP/1.1 connection pool size)
+HTTP_MAX_IN_FLIGHT = 1000
+
 
 async def http_session(
     client: httpx.AsyncClient,
-    base_url: str,
+    reset_url: httpx.URL,
+    step_url: httpx.URL,
+    step_body: bytes,
     request_id: int,
     wait_seconds: float,
+    in_flight: asyncio.Semaphore,
+    reset_latency: Optional[float] = None,
 ) -> SessionResult:
-    """Run HTTP reset + step with granular timing."""
+    """Run HTTP reset + step with granular timing.
+
+    step_body is the pre-encoded /step JSON payload for wait_seconds. The
+    session waits on in_flight before sending (the wait counts towards
+    total_latency). If reset_latency is given, the batch already issued a
+    shared reset and only the step is sent; the shared latency is recorded
+    on the result.
+    """
     timestamp = now_iso()
     t0 = time.perf_counter()
 
     try:
-        # Reset
-        t_reset_start = time.perf_counter()
-        reset_resp = await client.post(f"{base_url}/reset")
-        reset_resp.raise_for_status()
-        t_reset_end = time.perf_counter()
-        reset_latency = t_reset_end - t_reset_start
-
-        # Step
-        t_step_start = time.perf_counter()
-        step_resp = await client.post(
-            f"{base_url}/step",
-            json={"action": {"wait_seconds": wait_seconds}},
-        )
-        step_resp.raise_for_status()
-        t_step_end = time.perf_counter()
-        step_latency = t_step_end - t_step_start
+        async with in_flight:
+            # Reset
+            if reset_latency is None:
+                t_reset_start = time.perf_counter()
+                reset_resp = await client.post(reset_url)
+                reset_resp.raise_for_status()
+                t_reset_end = time.perf_counter()
+                reset_latency = t_reset_end - t_reset_start
+
+            # Step
+            t_step_start = time.perf_counter()
+            step_resp = await client.post(step_url, content=step_body, headers=JSON_HEADERS)
+            step_resp.raise_for_status()
+            t_step_end = time.perf_counter()
+            step_latency = t_step_end - t_step_start
 
         total_latency = time.perf_counter() - t0
-        result = step_resp.json()
+        result = _json_loads(step_resp.content)
         obs = result.get("observation", {})
 
         return SessionResult(
@@ -317,68 +381,153 @@ async def http_session(
         )
 
 
+def make_http_client(url: str, timeout: float, http2: bool = False) -> httpx.AsyncClient:
+    """Create the HTTP client for a server.
+
+    With http2, requests to https:// servers that negotiate HTTP/2 are
+    multiplexed over a few connections instead of one socket (and TLS
+    handshake) per in-flight request. Plain http:// stays on HTTP/1.1, so it
+    keeps the HTTP/1.1 connection limits.
+    """
+    if http2 and url.startswith("https://"):
+        # Streams are multiplexed, so far fewer sockets are needed
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+    else:
+        limits = httpx.Limits(max_connections=HTTP_MAX_IN_FLIGHT, max_keepalive_connections=100)
+    return httpx.AsyncClient(timeout=timeout, limits=limits, http2=http2)
+
+
 async def run_http_test(
     url: str,
     num_requests: int,
     wait_seconds: float,
     timeout: float = 120.0,
     hardware: str = "cpu-basic",
+    reset_once: bool = False,
+    http2: bool = False,
+    client: Optional[httpx.AsyncClient] = None,
+    max_in_flight: Optional[int] = None,
 ) -> List[SessionResult]:
-    """Run concurrent HTTP sessions."""
-    limits = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
-        tasks = [http_session(client, url, i, wait_seconds) for i in range(num_requests)]
-        results = await asyncio.gather(*tasks)
-        # Set batch_size and hardware on all results
-        for r in results:
-            r.batch_size = num_requests
-            r.hardware = hardware
-        return list(results)
+    """Run concurrent HTTP sessions.
+
+    HTTP /reset and /step each run against a fresh environment on the server,
+    so with reset_once a single reset is issued for the whole batch and the
+    sessions only step (1 + N requests instead of 2N).
+
+    If client is given (e.g. shared across a grid sweep), its connections are
+    reused; otherwise a client is created for this batch and closed after it.
+
+    At most max_in_flight sessions (default HTTP_MAX_IN_FLIGHT) send at once.
+    """
+    if client is None:
+        async with make_http_client(url, timeout, http2) as client:
+            return await run_http_test(
+                url, num_requests, wait_seconds, timeout, hardware, reset_once, http2, client, max_in_flight
+            )
+
+    # Parse the endpoint URLs once per batch rather than once per request
+    reset_url = httpx.URL(f"{url}/reset")
+    step_url = httpx.URL(f"{url}/step")
+    # Every session in the batch sends the same step payload
+    step_body = _json_dumps({"action": {"wait_seconds": wait_seconds}})
+
+    reset_latency = None
+    if reset_once:
+        try:
+            t_reset_start = time.perf_counter()
+            reset_resp = await client.post(reset_url)
+            reset_resp.raise_for_status()
+            reset_latency = time.perf_counter() - t_reset_start
+        except httpx.HTTPError:
+            # Fall back to per-session resets so failures are recorded per session
+            reset_latency = None
+
+    # Sessions beyond the cap queue here rather than on the connection pool
+    in_flight = asyncio.Semaphore(max_in_flight or HTTP_MAX_IN_FLIGHT)
+    results = await run_sessions(
+        http_session(client, reset_url, step_url, step_body, i, wait_seconds, in_flight, reset_latency)
+        for i in range(num_requests)
+    )
+    # Set batch_size and hardware on all results
+    for r in results:
+        r.batch_size = num_requests
+        r.hardware = hardware
+    return results
 
 
 # =============================================================================
 # WebSocket Mode
 # =============================================================================
 
+# Frames are encoded once and sent as str, since the server reads text frames
+WS_RESET_FRAME = _json_dumps({"type": "reset", "data": {}}).decode()
+WS_CLOSE_FRAME = _json_dumps({"type": "close"}).decode()
+# Server replies are compact pydantic JSON with "type" first, so errors can be
+# recognised without parsing the frame
+WS_ERROR_PREFIX = '{"type":"error"'
+
+# Sessions are short and exchange a few small frames: no keepalive pings
+# (one background task per connection), no per-message deflate, no size cap
+WS_CONNECT_OPTIONS = {"ping_interval": None, "compression": None, "max_size": None}
+
+
+def ws_step_frame(wait_seconds: float) -> str:
+    """Encoded step frame for a wait time, shared by every session of a run."""
+    return _json_dumps({"type": "step", "data": {"wait_seconds": wait_seconds}}).decode()
+
 
 async def ws_session(
     ws_url: str,
     request_id: int,
     wait_seconds: float,
     timeout: float = 60.0,
+    connecting: Optional[asyncio.Semaphore] = None,
+    step_frame: Optional[str] = None,
 ) -> SessionResult:
-    """Run WebSocket connect + reset + step with granular timing."""
+    """Run WebSocket connect + reset + step with granular timing.
+
+    step_frame is the pre-encoded step message (see ws_step_frame); it is
+    built from wait_seconds when not given.
+
+    If connecting is given, the handshake waits for a slot in it (the wait
+    counts towards total_latency only); the slot is released once connected.
+    """
     if websockets is None:
         raise ImportError("websockets not installed: pip install websockets")
 
+    if step_frame is None:
+        step_frame = ws_step_frame(wait_seconds)
+
     timestamp = now_iso()
     t0 = time.perf_counter()
 
     try:
         # Connect
-        t_connect_start = time.perf_counter()
-        ws = await asyncio.wait_for(
-            websockets.connect(ws_url, open_timeout=timeout),
-            timeout=timeout,
-        )
-        t_connect_end = time.perf_counter()
+        async with connecting or contextlib.nullcontext():
+            t_connect_start = time.perf_counter()
+            ws = await with_timeout(
+                websockets.connect(ws_url, open_timeout=timeout, **WS_CONNECT_OPTIONS),
+                timeout,
+            )
+            t_connect_end = time.perf_counter()
         connect_latency = t_connect_end - t_connect_start
 
         async with ws:
             # Reset
             t_reset_start = time.perf_counter()
-            await ws.send(json.dumps({"type": "reset", "data": {}}))
-            reset_response = json.loads(await asyncio.wait_for(ws.recv(), timeout))
+            await ws.send(WS_RESET_FRAME)
+            reset_response = await with_timeout(ws.recv(), timeout)
             t_reset_end = time.perf_counter()
             reset_latency = t_reset_end - t_reset_start
 
-            if reset_response.get("type") == "error":
-                raise RuntimeError(f"Reset error: {reset_response}")
+            # Only the reset outcome matters, so the frame is parsed just for errors
+            if reset_response.startswith(WS_ERROR_PREFIX):
+                raise RuntimeError(f"Reset error: {_json_loads(reset_response)}")
 
             # Step
             t_step_start = time.perf_counter()
-            await ws.send(json.dumps({"type": "step", "data": {"wait_seconds": wait_seconds}}))
-            step_response = json.loads(await asyncio.wait_for(ws.recv(), timeout))
+            await ws.send(step_frame)
+            step_response = _json_loads(await with_timeout(ws.recv(), timeout))
             t_step_end = time.perf_counter()
             step_latency = t_step_end - t_step_start
 
@@ -386,7 +535,7 @@ async def ws_session(
                 raise RuntimeError(f"Step error: {step_response}")
 
             # Close
-            await ws.send(json.dumps({"type": "close"}))
+            await ws.send(WS_CLOSE_FRAME)
 
         total_latency = time.perf_counter() - t0
         obs = step_response.get("data", {}).get("observation", {})
@@ -427,30 +576,37 @@ async def run_ws_test(
     timeout: float = 120.0,
     hardware: str = "cpu-basic",
     urls: Optional[List[str]] = None,
+    max_in_flight: Optional[int] = None,
 ) -> List[SessionResult]:
     """Run concurrent WebSocket sessions.
 
     If urls is provided (list of multiple URLs), distributes requests round-robin
     across all URLs to enable multi-node testing without a load balancer.
+
+    If max_in_flight is set, at most that many handshakes run at once; open
+    sessions are not limited. By default all N sessions connect together.
     """
+    connecting = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+    step_frame = ws_step_frame(wait_seconds)
+
     if urls and len(urls) > 1:
         # Multi-URL mode: distribute requests round-robin across URLs
         tasks = []
         for i in range(num_requests):
             target_url = urls[i % len(urls)]
             ws_url = convert_to_ws_url(target_url)
-            tasks.append(ws_session(ws_url, i, wait_seconds, timeout))
+            tasks.append(ws_session(ws_url, i, wait_seconds, timeout, connecting, step_frame))
     else:
         # Single URL mode
         ws_url = convert_to_ws_url(url)
-        tasks = [ws_session(ws_url, i, wait_seconds, timeout) for i in range(num_requests)]
+        tasks = [ws_session(ws_url, i, wait_seconds, timeout, connecting, step_frame) for i in range(num_requests)]
 
-    results = await asyncio.gather(*tasks)
+    results = await run_sessions(tasks)
     # Set batch_size and hardware on all results
     for r in results:
         r.batch_size = num_requests
         r.hardware = hardware
-    return list(results)
+    return results
 
 
 # =============================================================================
@@ -470,7 +626,7 @@ def compute_summary(
 ) -> RunSummary:
     """Compute aggregated statistics from session results."""
     successful = [r for r in results if r.success]
-    failed = [r for r in results if not r.success]
+    failed = len(results) - len(successful)
 
     summary = RunSummary(
         mode=mode,
@@ -482,47 +638,53 @@ def compute_summary(
         timestamp=now_iso(),
         hardware=hardware,
         successful=len(successful),
-        failed=len(failed),
-        error_rate=len(failed) / len(results) if results else 0.0,
+        failed=failed,
+        error_rate=failed / len(results) if results else 0.0,
         total_wall_time=total_wall_time,
     )
 
     if not successful:
         return summary
 
-    # Extract latencies
-    connect_times = [r.connect_latency for r in successful if r.connect_latency > 0]
-    reset_times = [r.reset_latency for r in successful if r.reset_latency > 0]
-    step_times = [r.step_latency for r in successful if r.step_latency > 0]
-    total_times = [r.total_latency for r in successful]
+    # One pass over the results: latencies plus the distribution sets
+    flat_latencies = []
+    pids, sessions, hosts = set(), set(), set()
+    for r in successful:
+        flat_latencies.extend((r.connect_latency, r.reset_latency, r.step_latency, r.total_latency))
+        if r.pid:
+            pids.add(r.pid)
+        if r.session_hash:
+            sessions.add(r.session_hash)
+        if r.host_url:
+            hosts.add(r.host_url)
+
+    # Latencies as one (n, 4) array: connect, reset, step, total
+    latencies = np.array(flat_latencies, dtype=np.float64).reshape(-1, 4)
+    connect_times = latencies[latencies[:, 0] > 0, 0]
+    reset_times = latencies[latencies[:, 1] > 0, 1]
+    step_times = latencies[latencies[:, 2] > 0, 2]
+    total_times = latencies[:, 3]
 
     # Connect latency stats
-    if connect_times:
-        summary.connect_p50 = percentile(connect_times, 50)
-        summary.connect_p95 = percentile(connect_times, 95)
-        summary.connect_p99 = percentile(connect_times, 99)
+    if connect_times.size:
+        summary.connect_p50, summary.connect_p95, summary.connect_p99 = percentiles(connect_times, (50, 95, 99))
 
     # Reset latency stats
-    if reset_times:
-        summary.reset_p50 = percentile(reset_times, 50)
-        summary.reset_p95 = percentile(reset_times, 95)
-        summary.reset_p99 = percentile(reset_times, 99)
+    if reset_times.size:
+        summary.reset_p50, summary.reset_p95, summary.reset_p99 = percentiles(reset_times, (50, 95, 99))
 
     # Step latency stats
-    if step_times:
-        summary.step_p50 = percentile(step_times, 50)
-        summary.step_p95 = percentile(step_times, 95)
-        summary.step_p99 = percentile(step_times, 99)
+    if step_times.size:
+        summary.step_p50, summary.step_p95, summary.step_p99 = percentiles(step_times, (50, 95, 99))
 
     # Total latency stats
-    if total_times:
-        summary.total_min = min(total_times)
-        summary.total_max = max(total_times)
-        summary.total_avg = statistics.mean(total_times)
-        summary.total_p50 = percentile(total_times, 50)
-        summary.total_p90 = percentile(total_times, 90)
-        summary.total_p95 = percentile(total_times, 95)
-        summary.total_p99 = percentile(total_times, 99)
+    if total_times.size:
+        summary.total_min = float(total_times.min())
+        summary.total_max = float(total_times.max())
+        summary.total_avg = float(total_times.mean())
+        summary.total_p50, summary.total_p90, summary.total_p95, summary.total_p99 = percentiles(
+            total_times, (50, 90, 95, 99)
+        )
 
     # Throughput
     if total_wall_time > 0:
@@ -530,9 +692,9 @@ def compute_summary(
         summary.effective_concurrency = (num_requests * wait_seconds) / total_wall_time
 
     # Distribution
-    summary.unique_pids = len(set(r.pid for r in successful if r.pid))
-    summary.unique_sessions = len(set(r.session_hash for r in successful if r.session_hash))
-    summary.unique_hosts = len(set(r.host_url for r in successful if r.host_url))
+    summary.unique_pids = len(pids)
+    summary.unique_sessions = len(sessions)
+    summary.unique_hosts = len(hosts)
 
     return summary
 
@@ -542,88 +704,95 @@ def compute_summary(
 # =============================================================================
 
 
-def write_jsonl(results: List[SessionResult], filepath: Path):
-    """Write session results to JSONL file."""
-    with open(filepath, "a") as f:
-        for r in results:
-            f.write(json.dumps(asdict(r)) + "\n")
+def write_jsonl(results: List[SessionResult], jsonl_file: BinaryIO):
+    """Append session results to an open JSONL file."""
+    jsonl_file.writelines(_json_dumps(r) + b"\n" for r in results)
 
 
-def write_csv_summary(summaries: List[RunSummary], filepath: Path):
-    """Write summaries to CSV file."""
-    if not summaries:
-        return
+# summary.csv columns, in RunSummary field order, and a getter building one row as a tuple
+SUMMARY_FIELDS = tuple(f.name for f in fields(RunSummary))
+summary_row = operator.attrgetter(*SUMMARY_FIELDS)
 
-    fieldnames = list(asdict(summaries[0]).keys())
-    file_exists = filepath.exists()
 
-    with open(filepath, "a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        if not file_exists:
-            writer.writeheader()
-        for s in summaries:
-            writer.writerow(asdict(s))
+def write_csv_summary(summaries: List[RunSummary], csv_writer):
+    """Append summaries as rows to an open summary.csv writer."""
+    csv_writer.writerows(map(summary_row, summaries))
+
+
+def open_outputs(output_dir: Path, stack: contextlib.ExitStack) -> tuple:
+    """Open raw.jsonl and summary.csv for appending, closed when ``stack`` exits.
+
+    Returns the JSONL file and a csv writer; the CSV header is written only
+    when summary.csv is new.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jsonl_file = stack.enter_context(open(output_dir / "raw.jsonl", "ab"))
+    csv_file = stack.enter_context(open(output_dir / "summary.csv", "a", newline=""))
+    csv_writer = csv.writer(csv_file)
+    if csv_file.tell() == 0:
+        csv_writer.writerow(SUMMARY_FIELDS)
+    return jsonl_file, csv_writer
 
 
 def print_summary(summary: RunSummary, verbose: bool = False):
-    """Print summary to console."""
-    print()
-    print("=" * 70)
-    print(
-        f"  {summary.mode.upper()} Mode | N={summary.num_requests} | wait={summary.wait_seconds}s | rep={summary.repetition}"
-    )
-    print("=" * 70)
-    print()
-    print(f"  URL: {summary.url}")
-    print(f"  Success: {summary.successful}/{summary.num_requests} ({(1 - summary.error_rate) * 100:.1f}%)")
-    print()
-    print("  Latency (seconds):")
-    print(f"    {'':12} {'P50':>10} {'P95':>10} {'P99':>10}")
-    print(f"    {'Connect':12} {summary.connect_p50:>10.4f} {summary.connect_p95:>10.4f} {summary.connect_p99:>10.4f}")
-    print(f"    {'Reset':12} {summary.reset_p50:>10.4f} {summary.reset_p95:>10.4f} {summary.reset_p99:>10.4f}")
-    print(f"    {'Step':12} {summary.step_p50:>10.4f} {summary.step_p95:>10.4f} {summary.step_p99:>10.4f}")
-    print(f"    {'Total':12} {summary.total_p50:>10.4f} {summary.total_p95:>10.4f} {summary.total_p99:>10.4f}")
-    print()
-    print(f"  Total wall time:       {summary.total_wall_time:.3f}s")
-    print(f"  Requests/sec:          {summary.requests_per_second:.1f}")
-    print(f"  Effective concurrency: {summary.effective_concurrency:.1f}x")
-    print()
-    print(f"  Distribution:")
-    print(f"    Unique PIDs:     {summary.unique_pids}")
-    print(f"    Unique sessions: {summary.unique_sessions}")
-    print(f"    Unique hosts:    {summary.unique_hosts}")
-    print()
+    """Print summary to console (as one write, so blocks from a sweep stay whole)."""
+    lines = [
+        "",
+        "=" * 70,
+        f"  {summary.mode.upper()} Mode | N={summary.num_requests} | wait={summary.wait_seconds}s | rep={summary.repetition}",
+        "=" * 70,
+        "",
+        f"  URL: {summary.url}",
+        f"  Success: {summary.successful}/{summary.num_requests} ({(1 - summary.error_rate) * 100:.1f}%)",
+        "",
+        "  Latency (seconds):",
+        f"    {'':12} {'P50':>10} {'P95':>10} {'P99':>10}",
+        f"    {'Connect':12} {summary.connect_p50:>10.4f} {summary.connect_p95:>10.4f} {summary.connect_p99:>10.4f}",
+        f"    {'Reset':12} {summary.reset_p50:>10.4f} {summary.reset_p95:>10.4f} {summary.reset_p99:>10.4f}",
+        f"    {'Step':12} {summary.step_p50:>10.4f} {summary.step_p95:>10.4f} {summary.step_p99:>10.4f}",
+        f"    {'Total':12} {summary.total_p50:>10.4f} {summary.total_p95:>10.4f} {summary.total_p99:>10.4f}",
+        "",
+        f"  Total wall time:       {summary.total_wall_time:.3f}s",
+        f"  Requests/sec:          {summary.requests_per_second:.1f}",
+        f"  Effective concurrency: {summary.effective_concurrency:.1f}x",
+        "",
+        "  Distribution:",
+        f"    Unique PIDs:     {summary.unique_pids}",
+        f"    Unique sessions: {summary.unique_sessions}",
+        f"    Unique hosts:    {summary.unique_hosts}",
+        "",
+    ]
+    print("\n".join(lines))
 
 
 def print_comparison(http_summary: RunSummary, ws_summary: RunSummary):
     """Print side-by-side comparison of HTTP vs WebSocket."""
-    print()
-    print("=" * 70)
-    print("  HTTP vs WebSocket Comparison")
-    print("=" * 70)
-    print()
-    print(f"  {'Metric':<30} {'HTTP':>15} {'WebSocket':>15}")
-    print(f"  {'-' * 30} {'-' * 15} {'-' * 15}")
-    print(
-        f"  {'Success Rate':<30} {(1 - http_summary.error_rate) * 100:>14.1f}% {(1 - ws_summary.error_rate) * 100:>14.1f}%"
-    )
-    print(f"  {'Total Wall Time (s)':<30} {http_summary.total_wall_time:>15.3f} {ws_summary.total_wall_time:>15.3f}")
-    print(f"  {'Requests/sec':<30} {http_summary.requests_per_second:>15.1f} {ws_summary.requests_per_second:>15.1f}")
-    print(
-        f"  {'Effective Concurrency':<30} {http_summary.effective_concurrency:>15.1f} {ws_summary.effective_concurrency:>15.1f}"
-    )
-    print()
-    print(f"  {'Connect P50 (s)':<30} {'N/A':>15} {ws_summary.connect_p50:>15.4f}")
-    print(f"  {'Reset P50 (s)':<30} {http_summary.reset_p50:>15.4f} {ws_summary.reset_p50:>15.4f}")
-    print(f"  {'Step P50 (s)':<30} {http_summary.step_p50:>15.4f} {ws_summary.step_p50:>15.4f}")
-    print(f"  {'Total P50 (s)':<30} {http_summary.total_p50:>15.4f} {ws_summary.total_p50:>15.4f}")
-    print(f"  {'Total P95 (s)':<30} {http_summary.total_p95:>15.4f} {ws_summary.total_p95:>15.4f}")
-    print(f"  {'Total P99 (s)':<30} {http_summary.total_p99:>15.4f} {ws_summary.total_p99:>15.4f}")
-    print()
-    print(f"  {'Unique PIDs':<30} {http_summary.unique_pids:>15} {ws_summary.unique_pids:>15}")
-    print(f"  {'Unique Sessions':<30} {http_summary.unique_sessions:>15} {ws_summary.unique_sessions:>15}")
-    print(f"  {'Unique Hosts':<30} {http_summary.unique_hosts:>15} {ws_summary.unique_hosts:>15}")
-    print()
+    lines = [
+        "",
+        "=" * 70,
+        "  HTTP vs WebSocket Comparison",
+        "=" * 70,
+        "",
+        f"  {'Metric':<30} {'HTTP':>15} {'WebSocket':>15}",
+        f"  {'-' * 30} {'-' * 15} {'-' * 15}",
+        f"  {'Success Rate':<30} {(1 - http_summary.error_rate) * 100:>14.1f}% {(1 - ws_summary.error_rate) * 100:>14.1f}%",
+        f"  {'Total Wall Time (s)':<30} {http_summary.total_wall_time:>15.3f} {ws_summary.total_wall_time:>15.3f}",
+        f"  {'Requests/sec':<30} {http_summary.requests_per_second:>15.1f} {ws_summary.requests_per_second:>15.1f}",
+        f"  {'Effective Concurrency':<30} {http_summary.effective_concurrency:>15.1f} {ws_summary.effective_concurrency:>15.1f}",
+        "",
+        f"  {'Connect P50 (s)':<30} {'N/A':>15} {ws_summary.connect_p50:>15.4f}",
+        f"  {'Reset P50 (s)':<30} {http_summary.reset_p50:>15.4f} {ws_summary.reset_p50:>15.4f}",
+        f"  {'Step P50 (s)':<30} {http_summary.step_p50:>15.4f} {ws_summary.step_p50:>15.4f}",
+        f"  {'Total P50 (s)':<30} {http_summary.total_p50:>15.4f} {ws_summary.total_p50:>15.4f}",
+        f"  {'Total P95 (s)':<30} {http_summary.total_p95:>15.4f} {ws_summary.total_p95:>15.4f}",
+        f"  {'Total P99 (s)':<30} {http_summary.total_p99:>15.4f} {ws_summary.total_p99:>15.4f}",
+        "",
+        f"  {'Unique PIDs':<30} {http_summary.unique_pids:>15} {ws_summary.unique_pids:>15}",
+        f"  {'Unique Sessions':<30} {http_summary.unique_sessions:>15} {ws_summary.unique_sessions:>15}",
+        f"  {'Unique Hosts':<30} {http_summary.unique_hosts:>15} {ws_summary.unique_hosts:>15}",
+        "",
+    ]
+    print("\n".join(lines))
 
 
 # =============================================================================
@@ -644,8 +813,18 @@ async def run_single_test(
     expected_hosts: int = 1,
     require_hosts: bool = False,
     urls: Optional[List[str]] = None,
+    reset_once: bool = False,
+    http2: bool = False,
+    client: Optional[httpx.AsyncClient] = None,
+    max_in_flight: Optional[int] = None,
+    jsonl_file: Optional[BinaryIO] = None,
+    csv_writer: Optional[Any] = None,
 ) -> RunSummary:
-    """Run a single test configuration."""
+    """Run a single test configuration.
+
+    Results go to ``jsonl_file``/``csv_writer`` when given (see open_outputs),
+    otherwise to files opened under ``output_dir`` for this run only.
+    """
     urls_info = f" ({len(urls)} URLs)" if urls and len(urls) > 1 else ""
     print(f"\n[{mode.upper()}] N={num_requests}, wait={wait_seconds}s, rep={repetition}{urls_info}")
 
@@ -654,21 +833,25 @@ async def run_single_test(
     if mode == "ws":
         if websockets is None:
             raise ImportError("websockets not installed for ws mode")
-        results = await run_ws_test(url, num_requests, wait_seconds, timeout, hardware, urls)
+        results = await run_ws_test(url, num_requests, wait_seconds, timeout, hardware, urls, max_in_flight)
     else:
-        results = await run_http_test(url, num_requests, wait_seconds, timeout, hardware)
+        results = await run_http_test(
+            url, num_requests, wait_seconds, timeout, hardware, reset_once, http2, client, max_in_flight
+        )
 
     total_wall_time = time.perf_counter() - start
 
     summary = compute_summary(results, mode, url, num_requests, wait_seconds, repetition, total_wall_time, hardware)
 
     # Write outputs
-    if output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        jsonl_path = output_dir / "raw.jsonl"
-        csv_path = output_dir / "summary.csv"
-        write_jsonl(results, jsonl_path)
-        write_csv_summary([summary], csv_path)
+    if jsonl_file is not None:
+        write_jsonl(results, jsonl_file)
+        write_csv_summary([summary], csv_writer)
+    elif output_dir:
+        with contextlib.ExitStack() as stack:
+            jsonl_file, csv_writer = open_outputs(output_dir, stack)
+            write_jsonl(results, jsonl_file)
+            write_csv_summary([summary], csv_writer)
 
     if verbose:
         print_summary(summary, verbose)
@@ -702,8 +885,17 @@ async def run_grid_sweep(
     expected_hosts: int = 1,
     require_hosts: bool = False,
     urls: Optional[List[str]] = None,
+    reset_once: bool = False,
+    http2: bool = False,
+    reuse_client: bool = False,
+    max_in_flight: Optional[int] = None,
+    pause: float = 0.5,
 ) -> List[RunSummary]:
-    """Run 2D grid sweep over requests × wait values with repetitions."""
+    """Run 2D grid sweep over requests × wait values with repetitions.
+
+    After a run with failures the sweep pauses for ``pause`` seconds before
+    the next one; runs that fully succeeded follow each other immediately.
+    """
     all_summaries = []
 
     total_configs = len(requests_grid) * len(wait_grid) * repetitions
@@ -720,31 +912,43 @@ async def run_grid_sweep(
     if expected_hosts > 1:
         print(f"Expected hosts: {expected_hosts} (multi-node validation {'STRICT' if require_hosts else 'enabled'})")
 
-    for n in requests_grid:
-        for w in wait_grid:
-            for rep in range(1, repetitions + 1):
-                current += 1
-                print(f"\n[{current}/{total_configs}]", end="")
-
-                summary = await run_single_test(
-                    url=url,
-                    num_requests=n,
-                    wait_seconds=w,
-                    mode=mode,
-                    timeout=timeout,
-                    hardware=hardware,
-                    repetition=rep,
-                    output_dir=output_dir,
-                    verbose=verbose,
-                    expected_hosts=expected_hosts,
-                    require_hosts=require_hosts,
-                    urls=urls,
-                )
-                all_summaries.append(summary)
-
-                # Brief pause between runs
-                if current < total_configs:
-                    await asyncio.sleep(0.5)
+    # With reuse_client, HTTP runs share one client so keep-alive connections carry over
+    shared_client = make_http_client(url, timeout, http2) if reuse_client and mode == "http" else None
+    # Output files stay open for the whole sweep instead of reopening per run
+    with contextlib.ExitStack() as outputs:
+        jsonl_file, csv_writer = open_outputs(output_dir, outputs) if output_dir else (None, None)
+        async with shared_client or contextlib.nullcontext() as client:
+            for n in requests_grid:
+                for w in wait_grid:
+                    for rep in range(1, repetitions + 1):
+                        current += 1
+                        print(f"\n[{current}/{total_configs}]", end="")
+
+                        summary = await run_single_test(
+                            url=url,
+                            num_requests=n,
+                            wait_seconds=w,
+                            mode=mode,
+                            timeout=timeout,
+                            hardware=hardware,
+                            repetition=rep,
+                            output_dir=output_dir,
+                            verbose=verbose,
+                            expected_hosts=expected_hosts,
+                            require_hosts=require_hosts,
+                            urls=urls,
+                            reset_once=reset_once,
+                            http2=http2,
+                            client=client,
+                            max_in_flight=max_in_flight,
+                            jsonl_file=jsonl_file,
+                            csv_writer=csv_writer,
+                        )
+                        all_summaries.append(summary)
+
+                        # Give the server a moment to recover before the next run
+                        if summary.failed and current < total_configs:
+                            await asyncio.sleep(pause)
 
     return all_summaries
 
@@ -756,6 +960,9 @@ async def run_comparison(
     timeout: float,
     output_dir: Optional[Path] = None,
     hardware: str = "cpu-basic",
+    reset_once: bool = False,
+    http2: bool = False,
+    max_in_flight: Optional[int] = None,
 ) -> tuple:
     """Run HTTP vs WebSocket comparison."""
     if websockets is None:
@@ -770,14 +977,34 @@ async def run_comparison(
 
     # Run HTTP
     http_summary = await run_single_test(
-        url, num_requests, wait_seconds, "http", timeout, 1, output_dir, verbose=False, hardware=hardware
+        url,
+        num_requests,
+        wait_seconds,
+        "http",
+        timeout,
+        1,
+        output_dir,
+        verbose=False,
+        hardware=hardware,
+        reset_once=reset_once,
+        http2=http2,
+        max_in_flight=max_in_flight,
     )
 
     await asyncio.sleep(1)  # Brief pause
 
     # Run WebSocket
     ws_summary = await run_single_test(
-        url, num_requests, wait_seconds, "ws", timeout, 1, output_dir, verbose=False, hardware=hardware
+        url,
+        num_requests,
+        wait_seconds,
+        "ws",
+        timeout,
+        1,
+        output_dir,
+        verbose=False,
+        hardware=hardware,
+        max_in_flight=max_in_flight,
     )
 
     print_comparison(http_summary, ws_summary)
@@ -790,7 +1017,7 @@ async def run_comparison(
 # =============================================================================
 
 
-async def main():
+async def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="OpenEnv benchmark scaling and concurrency test",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -809,6 +1036,8 @@ Examples:
   # Save to files
   python tests/test_scaling.py --url http://localhost:8000 -n 100 \\
       --output-dir results/experiment1
+
+The event loop runs on uvloop when it is installed (pip install uvloop).
         """,
     )
 
@@ -827,6 +1056,26 @@ Examples:
     )
     parser.add_argument("--wait", "-w", type=float, default=1.0, help="Wait time per request (seconds)")
     parser.add_argument("--mode", "-m", choices=["http", "ws"], default="ws", help="Test mode")
+    parser.add_argument(
+        "--reset-once",
+        action="store_true",
+        help="HTTP mode: issue one /reset per batch instead of one per session (reset latencies then reflect that single call)",
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="HTTP mode: enable HTTP/2 multiplexing for https:// servers (requires: pip install 'httpx[http2]')",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help=f"Max concurrent WebSocket handshakes / HTTP sessions (default: unlimited for WS, {HTTP_MAX_IN_FLIGHT} for HTTP)",
+    )
+    parser.add_argument(
+        "--reuse-client",
+        action="store_true",
+        help="HTTP grid sweeps: share one client across runs so connections stay open between them",
+    )
 
     # Grid sweep
     parser.add_argument(
@@ -837,6 +1086,12 @@ Examples:
     )
     parser.add_argument("--wait-grid", type=str, help="Comma-separated wait times (e.g., 0.1,1.0)")
     parser.add_argument("--reps", type=int, default=1, help="Repetitions per configuration")
+    parser.add_argument(
+        "--pause",
+        type=float,
+        default=0.5,
+        help="Seconds to let the server recover after a grid run with failures (clean runs don't pause)",
+    )
 
     # Comparison
     parser.add_argument("--compare", action="store_true", help="Compare HTTP vs WebSocket")
@@ -866,7 +1121,7 @@ Examples:
     parser.add_argument("--output-dir", "-o", type=str, help="Directory for JSONL/CSV output")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate
     if args.mode == "ws" and websockets is None:
@@ -874,6 +1129,14 @@ Examples:
         print("  pip install websockets")
         sys.exit(1)
 
+    if args.http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            print("Error: h2 not installed for --http2:")
+            print("  pip install 'httpx[http2]'")
+            sys.exit(1)
+
     url = args.url.rstrip("/")
     output_dir = Path(args.output_dir) if args.output_dir else None
 
@@ -889,7 +1152,17 @@ Examples:
     # Determine test mode
     if args.compare:
         # HTTP vs WebSocket comparison
-        await run_comparison(url, args.requests, args.wait, args.timeout, output_dir, args.hardware)
+        await run_comparison(
+            url,
+            args.requests,
+            args.wait,
+            args.timeout,
+            output_dir,
+            args.hardware,
+            args.reset_once,
+            args.http2,
+            args.max_in_flight,
+        )
 
     elif args.requests_grid or args.wait_grid:
         # Grid sweep mode
@@ -909,6 +1182,11 @@ Examples:
             expected_hosts=args.expected_hosts,
             require_hosts=args.require_hosts,
             urls=urls,
+            reset_once=args.reset_once,
+            http2=args.http2,
+            reuse_client=args.reuse_client,
+            max_in_flight=args.max_in_flight,
+            pause=args.pause,
         )
 
         # Print final summary table
@@ -941,11 +1219,23 @@ Examples:
             expected_hosts=args.expected_hosts,
             require_hosts=args.require_hosts,
             urls=urls,
+            reset_once=args.reset_once,
+            http2=args.http2,
+            max_in_flight=args.max_in_flight,
         )
 
         if output_dir:
             print(f"\n  Results saved to: {output_dir}/")
 
 
+def run(argv: Optional[List[str]] = None):
+    """Run main() on uvloop when it is installed, else on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main(argv))
+    return uvloop.run(main(argv))
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()